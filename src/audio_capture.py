@@ -1,9 +1,13 @@
 """Audio capture with Voice Activity Detection (VAD)."""
 
-import collections
+import atexit
+import functools
+import math
+import queue
 import threading
 import time
 from collections.abc import Callable, Iterator
+from typing import Any
 
 import numpy as np
 import sounddevice as sd
@@ -12,6 +16,113 @@
 
 from src.config import AudioConfig, VADConfig
 
+# Scale factor from int16 PCM to float32 in [-1, 1]
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# Silent windows run through the VAD model right after loading
+_VAD_WARMUP_PASSES = 3
+
+_NS_PER_SECOND = 1_000_000_000
+
+# Silero VAD model shared by every AudioRecorder in the process. It is loaded
+# (and warmed up) once; each recording resets its state before use.
+_VAD_MODEL_CACHE: dict[str, Any] = {}
+_VAD_MODEL_CACHE_LOCK = threading.Lock()
+_VAD_MODEL_KEY = "silero_vad_onnx"
+_VAD_HUB_REPO = "snakers4/silero-vad:master"
+
+# Give up on a recording if no speech starts within this delay
+_NO_SPEECH_TIMEOUT_NS = 5 * _NS_PER_SECOND
+
+# Energy gate in front of the VAD: before speech starts, chunks whose RMS stays
+# below this multiple of the tracked noise floor are treated as silence
+_ENERGY_GATE_RATIO = 3.0
+# The gate only turns on after this many chunks were scored as non-speech by
+# the VAD itself (the first chunks may hold speech the cold model scores low)
+_ENERGY_GATE_WARMUP_CHUNKS = 10
+# Smoothing factor of the noise floor (exponential moving average of RMS)
+_NOISE_FLOOR_ALPHA = 0.01
+
+
+@functools.lru_cache(maxsize=1)
+def _query_devices() -> sd.DeviceList:
+    """Return the audio device list, queried from PortAudio once per process.
+
+    PortAudio enumerates devices when it is initialized, so repeated queries
+    return the same list; caching skips the host API round-trip.
+    """
+    return sd.query_devices()
+
+
+class AudioRingBuffer:
+    """Fixed-size float32 ring buffer backed by a preallocated NumPy array.
+
+    Behaves like ``collections.deque(maxlen=...)`` of samples (the oldest
+    samples are overwritten once full), but appends whole chunks with slice
+    copies instead of boxing every sample into a Python float.
+    """
+
+    def __init__(self, maxlen: int):
+        """Initialize ring buffer.
+
+        Args:
+            maxlen: Maximum number of samples kept in the buffer
+        """
+        self.maxlen = maxlen
+        self._data = np.empty(maxlen, dtype=np.float32)
+        self._write_pos = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return number of buffered samples."""
+        return self._size
+
+    def extend(self, samples: np.ndarray) -> None:
+        """Append samples, overwriting the oldest ones when full.
+
+        Args:
+            samples: Audio samples to append
+        """
+        n = len(samples)
+        if n == 0 or self.maxlen == 0:
+            return
+
+        if n >= self.maxlen:
+            # Only the most recent maxlen samples survive
+            self._data[:] = samples[-self.maxlen :]
+            self._write_pos = 0
+            self._size = self.maxlen
+            return
+
+        end = self._write_pos + n
+        if end <= self.maxlen:
+            self._data[self._write_pos : end] = samples
+        else:
+            # Wrap around: split the copy in two segments
+            first = self.maxlen - self._write_pos
+            self._data[self._write_pos :] = samples[:first]
+            self._data[: n - first] = samples[first:]
+
+        self._write_pos = end % self.maxlen
+        self._size = min(self._size + n, self.maxlen)
+
+    def clear(self) -> None:
+        """Remove all samples (the backing storage is kept)."""
+        self._write_pos = 0
+        self._size = 0
+
+    def to_array(self) -> np.ndarray:
+        """Return buffered samples, oldest first.
+
+        Returns:
+            New contiguous float32 array (safe to keep after the buffer is reused)
+        """
+        if self._size < self.maxlen:
+            # Not wrapped yet: samples are stored contiguously from index 0
+            return self._data[: self._size].copy()
+
+        return np.concatenate((self._data[self._write_pos :], self._data[: self._write_pos]))
+
 
 class AudioRecorder:
     """Audio recorder with silence detection using Silero VAD."""
@@ -38,31 +149,69 @@ def __init__(
 
         # Audio buffer (ring buffer for pre-buffering)
         max_samples = audio_config.sample_rate * audio_config.max_recording_duration
-        self.buffer = collections.deque(maxlen=max_samples)
+        self.buffer = AudioRingBuffer(max_samples)
 
         # Recording state
         self.is_recording = False
         self.speech_started = False
-        self.last_speech_time = 0.0
-        self.recording_start_time = 0.0
+        # Timestamps from time.monotonic_ns()
+        self.last_speech_time = 0
+        self.recording_start_time = 0
+
+        # Durations in nanoseconds, compared against monotonic timestamps
+        self._silence_duration_ns = int(audio_config.silence_duration * _NS_PER_SECOND)
+
+        # Config values read for every chunk, hoisted out of the config objects
+        self._vad_threshold = vad_config.threshold
+        self._max_recording_duration_ns = audio_config.max_recording_duration * _NS_PER_SECOND
 
         # VAD model (loaded lazily)
         self.vad_model = None
         self._vad_sample_rate = 16000  # Silero VAD expects 16kHz
+        self._vad_window_size = 512  # Silero VAD window at 16kHz
+
+        # VAD input tensor reused across calls (filled through its NumPy view)
+        self._vad_input = torch.zeros(self._vad_window_size, dtype=torch.float32)
+        self._vad_input_np = self._vad_input.numpy()
+
+        # Samples carried over in _vad_input_np until a full window is available,
+        # and the last probability reported while a window is still filling
+        self._vad_fill = 0
+        self._last_speech_prob = 0.0
+
+        # Background RMS level, tracked on chunks the VAD scored as non-speech,
+        # and how many such chunks were measured so far
+        self._noise_floor = 0.0
+        self._noise_chunks = 0
+
+        # VAD inference errors in the current recording
+        self._vad_failures = 0
 
         # Pre-buffer for capturing speech start
         self.pre_buffer_duration = 0.5  # seconds
         self.pre_buffer_samples = int(self.pre_buffer_duration * audio_config.sample_rate)
-        self.pre_buffer = collections.deque(maxlen=self.pre_buffer_samples)
+        self.pre_buffer = AudioRingBuffer(self.pre_buffer_samples)
 
         # Minimum speech duration (avoid false starts)
         self.min_speech_samples = int(audio_config.min_speech_duration * audio_config.sample_rate)
 
+        # Chunks handed from the audio callback to the VAD worker thread
+        # (None is the stop sentinel)
+        self._audio_queue: queue.SimpleQueue[np.ndarray | None] = queue.SimpleQueue()
+        self._vad_thread: threading.Thread | None = None
+
+        # Set by the VAD worker when silence ends a (non-continuous) recording
+        self._stop_recording = threading.Event()
+
         # Continuous mode state
         self._continuous_mode = False
         self._stop_continuous = threading.Event()
-        self._segment_ready = threading.Event()
-        self._current_segment: np.ndarray | None = None
+        # Finished segments handed from the VAD worker to record_continuous()
+        self._segment_queue: queue.SimpleQueue[np.ndarray] = queue.SimpleQueue()
+
+        # Input stream opened on the first recording and kept running between
+        # recordings (the callback drops audio while is_recording is False)
+        self._stream: sd.InputStream | None = None
 
         logger.info(
             f"AudioRecorder initialized: {audio_config.sample_rate}Hz, "
@@ -71,100 +220,286 @@ def __init__(
         )
 
     def _load_vad_model(self):
-        """Load Silero VAD model (lazy loading)."""
+        """Load Silero VAD model (lazy loading, shared across recorders)."""
         if self.vad_model is not None:
             return
 
         try:
-            logger.info("Loading Silero VAD model...")
-            # Loading from official Silero VAD repository - safe and expected
-            self.vad_model, _ = torch.hub.load(  # nosec B614
-                repo_or_dir="snakers4/silero-vad",
-                model="silero_vad",
-                force_reload=False,
-                onnx=False,  # Use PyTorch version
-            )
-            self.vad_model.eval()
-            logger.info("Silero VAD model loaded successfully")
+            with _VAD_MODEL_CACHE_LOCK:
+                model = _VAD_MODEL_CACHE.get(_VAD_MODEL_KEY)
+                if model is None:
+                    logger.info("Loading Silero VAD model (ONNX Runtime)...")
+                    # Loading from official Silero VAD repository - safe and expected
+                    # The ONNX build runs on ONNX Runtime (single-threaded CPU session),
+                    # avoiding PyTorch dispatcher overhead on every audio callback.
+                    # The branch is pinned: without it torch.hub asks GitHub for the
+                    # default branch on every load, even when the repo is cached.
+                    model, _ = torch.hub.load(  # nosec B614
+                        repo_or_dir=_VAD_HUB_REPO,
+                        model="silero_vad",
+                        force_reload=False,
+                        onnx=True,
+                        force_onnx_cpu=True,
+                    )
+                    self.vad_model = model
+                    self._warm_up_vad_model()
+                    _VAD_MODEL_CACHE[_VAD_MODEL_KEY] = model
+                    logger.info("Silero VAD model loaded successfully")
+                else:
+                    logger.debug("Reusing already loaded Silero VAD model")
+
+            self.vad_model = model
 
         except Exception as e:
+            self.vad_model = None
             logger.error(f"Failed to load VAD model: {e}")
             raise RuntimeError(f"VAD model loading failed: {e}")
 
+    def _warm_up_vad_model(self):
+        """Run a few silent windows through the VAD model.
+
+        The first inferences pay for ONNX Runtime session setup and memory
+        allocation; doing them here keeps that cost off the first audio chunks.
+        The model's recurrent state is reset afterwards.
+        """
+        self._vad_input_np[:] = 0.0
+        for _ in range(_VAD_WARMUP_PASSES):
+            self.vad_model(self._vad_input, self._vad_sample_rate)
+        self.vad_model.reset_states()
+
+    def _reset_vad_state(self):
+        """Clear the VAD state (model and partial window) left by a previous recording."""
+        self._vad_fill = 0
+        self._last_speech_prob = 0.0
+        self._noise_floor = 0.0
+        self._noise_chunks = 0
+        self._vad_failures = 0
+        if self.vad_model is not None:
+            self.vad_model.reset_states()
+
     def _detect_speech(self, audio_chunk: np.ndarray) -> float:
         """Detect speech in audio chunk using VAD.
 
         Args:
-            audio_chunk: Audio data (float32, normalized to [-1, 1])
+            audio_chunk: Audio data (float32, normalized to [-1, 1]). The audio
+                callback does any int16 conversion before chunks get here.
 
         Returns:
             Speech probability (0.0 to 1.0)
+
+        Raises:
+            TypeError: If the chunk is not float32
+            Exception: Any VAD inference error, handled by _process_chunk
         """
+        if audio_chunk.dtype != np.float32:
+            raise TypeError(f"VAD expects float32 audio in [-1, 1], got {audio_chunk.dtype}")
+
         if self.vad_model is None:
             self._load_vad_model()
 
-        try:
-            # Ensure audio is the right shape and type
-            if audio_chunk.dtype != np.float32:
-                audio_chunk = audio_chunk.astype(np.float32)
-
-            # Normalize if needed
-            if np.abs(audio_chunk).max() > 1.0:
-                audio_chunk = audio_chunk / 32768.0
-
-            # Convert to torch tensor
-            audio_tensor = torch.from_numpy(audio_chunk)
-
-            # Ensure 1D
-            if audio_tensor.dim() > 1:
-                audio_tensor = audio_tensor.squeeze()
-
-            # VAD inference
-            with torch.no_grad():
-                speech_prob = self.vad_model(audio_tensor, self._vad_sample_rate).item()
-
-            return speech_prob
-
-        except Exception as e:
-            logger.warning(f"VAD detection failed: {e}")
-            return 0.0
+        # Ensure 1D
+        audio_chunk = audio_chunk.reshape(-1)
+
+        # Silero scores fixed-size windows. Chunks are accumulated into the
+        # reusable input tensor so every model call sees exactly one full
+        # window; a block spanning several windows is scored window by
+        # window (the model is stateful, so the windows cannot be batched)
+        # and the most confident window wins.
+        window_size = self._vad_window_size
+        window = self._vad_input_np
+        fill = self._vad_fill
+        speech_prob = None
+
+        if fill:
+            # Complete the window left over from previous chunks
+            take = min(window_size - fill, len(audio_chunk))
+            window[fill : fill + take] = audio_chunk[:take]
+            audio_chunk = audio_chunk[take:]
+            fill += take
+            if fill < window_size:
+                self._vad_fill = fill
+                return self._last_speech_prob
+
+            self._vad_fill = fill = 0
+            speech_prob = self.vad_model(self._vad_input, self._vad_sample_rate).item()
+
+        # VAD inference (ONNX Runtime builds no autograd graph, so no
+        # torch.no_grad() context is needed around it)
+        n_windows = len(audio_chunk) // window_size
+        for start in range(0, n_windows * window_size, window_size):
+            window[:] = audio_chunk[start : start + window_size]
+            window_prob = self.vad_model(self._vad_input, self._vad_sample_rate).item()
+            speech_prob = window_prob if speech_prob is None else max(speech_prob, window_prob)
+
+        # Keep the tail for the next chunk
+        rest = len(audio_chunk) - n_windows * window_size
+        if rest:
+            window[:rest] = audio_chunk[n_windows * window_size :]
+            self._vad_fill = rest
+
+        if speech_prob is None:
+            # No complete window yet: hold the last decision
+            return self._last_speech_prob
+
+        self._last_speech_prob = speech_prob
+        return speech_prob
 
     def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status):
         """Callback for sounddevice stream.
 
+        Runs on the PortAudio real-time thread, so it only copies the chunk out
+        of the stream buffer and hands it to the VAD worker thread.
+
         Args:
             indata: Input audio data
             frames: Number of frames
             time_info: Time information
             status: Stream status
         """
+        if not self.is_recording:
+            return
+
         if status:
             logger.warning(f"Audio callback status: {status}")
 
         # Convert to float32 if needed
-        audio_chunk = indata[:, 0].copy() if indata.ndim > 1 else indata.copy()
+        channel = indata[:, 0] if indata.ndim > 1 else indata
 
-        if audio_chunk.dtype == np.int16:
-            audio_chunk = audio_chunk.astype(np.float32) / 32768.0
+        if channel.dtype == np.int16:
+            # Cast and scale in a single pass (this also makes the copy)
+            audio_chunk = np.multiply(channel, _INT16_SCALE, dtype=np.float32)
+        else:
+            audio_chunk = channel.copy()
+
+        self._audio_queue.put(audio_chunk)
+
+    def _vad_loop(self) -> None:
+        """Consume audio chunks queued by the callback until the stop sentinel."""
+        # Bound once: the loop runs for every chunk of the recording
+        get_chunk = self._audio_queue.get
+        process_chunk = self._process_chunk
+
+        while (audio_chunk := get_chunk()) is not None:
+            process_chunk(audio_chunk)
+
+    def _start_vad_worker(self) -> None:
+        """Start the VAD worker thread for a new recording."""
+        self._audio_queue = queue.SimpleQueue()
+        self._vad_thread = threading.Thread(target=self._vad_loop, name="vad-worker", daemon=True)
+        self._vad_thread.start()
+
+    def _stop_vad_worker(self) -> None:
+        """Stop the VAD worker thread once already queued chunks are processed."""
+        if self._vad_thread is None:
+            return
+
+        self._audio_queue.put(None)
+        self._vad_thread.join()
+        self._vad_thread = None
+
+    def _ensure_stream(self) -> sd.InputStream:
+        """Open and start the input stream once, reusing it for later recordings.
+
+        Returns:
+            The running input stream
+        """
+        if self._stream is not None and not self._stream.active:
+            # PortAudio stopped it on its own (device unplugged, host error)
+            logger.warning("Audio input stream is no longer active, reopening it")
+            self.close()
+
+        if self._stream is None:
+            stream = sd.InputStream(
+                samplerate=self.audio_config.sample_rate,
+                channels=self.audio_config.channels,
+                dtype=np.float32,
+                blocksize=self.audio_config.blocksize,
+                callback=self._audio_callback,
+            )
+            stream.start()
+            self._stream = stream
+            atexit.register(self.close)
+            logger.debug("Audio input stream opened")
+
+        return self._stream
+
+    def close(self) -> None:
+        """Close the input stream (reopened by the next recording)."""
+        if self._stream is None:
+            return
+
+        stream = self._stream
+        self._stream = None
+        atexit.unregister(self.close)
+
+        try:
+            stream.close()
+        except Exception as e:
+            logger.warning(f"Failed to close audio stream: {e}")
+
+    def _process_chunk(self, audio_chunk: np.ndarray) -> None:
+        """Run VAD on a chunk and update the recording state machine.
+
+        Args:
+            audio_chunk: Audio data (float32, normalized to [-1, 1])
+        """
+        speech_started = self.speech_started
+
+        rms = 0.0
+        # Whether the VAD model actually runs on this chunk (it completes a window)
+        scored = self._vad_fill + len(audio_chunk) >= self._vad_window_size
+        try:
+            if speech_started:
+                # Always run the VAD once speaking, to find the end of speech
+                speech_prob = self._detect_speech(audio_chunk)
+            else:
+                # Skip the VAD on chunks no louder than the background noise
+                rms = math.sqrt(float(np.dot(audio_chunk, audio_chunk)) / len(audio_chunk))
+                if (
+                    self._noise_chunks >= _ENERGY_GATE_WARMUP_CHUNKS
+                    and rms < self._noise_floor * _ENERGY_GATE_RATIO
+                ):
+                    speech_prob = 0.0
+                    scored = False
+                    self._vad_fill = 0  # The next window must not span the gap
+                else:
+                    speech_prob = self._detect_speech(audio_chunk)
 
-        # Detect speech
-        speech_prob = self._detect_speech(audio_chunk)
+        except Exception as e:
+            # Treat the chunk as silence; warn once per recording, not per chunk
+            scored = False
+            self._vad_fill = 0
+            self._vad_failures += 1
+            if self._vad_failures == 1:
+                logger.warning(f"VAD detection failed: {e}")
+            else:
+                logger.debug(f"VAD detection failed ({self._vad_failures} times): {e}")
+            speech_prob = 0.0
 
-        current_time = time.time()
+        current_time = time.monotonic_ns()
 
         # Check if speech is detected
-        is_speech = speech_prob > self.vad_config.threshold
+        is_speech = speech_prob > self._vad_threshold
+
+        if scored and not is_speech and not speech_started:
+            # Only chunks the VAD judged non-speech feed the floor, never gated ones
+            if self._noise_chunks < _ENERGY_GATE_WARMUP_CHUNKS:
+                # Seed with the quietest chunk: a louder one may be missed speech
+                self._noise_floor = min(self._noise_floor, rms) if self._noise_chunks else rms
+                self._noise_chunks += 1
+            else:
+                self._noise_floor += _NOISE_FLOOR_ALPHA * (rms - self._noise_floor)
 
         if is_speech:
             self.last_speech_time = current_time
 
-            if not self.speech_started:
+            if not speech_started:
                 # Speech just started
                 self.speech_started = True
 
                 # Add pre-buffer to main buffer
                 if self.pre_buffer:
-                    self.buffer.extend(self.pre_buffer)
+                    self.buffer.extend(self.pre_buffer.to_array())
                     self.pre_buffer.clear()
 
                 if self.on_speech_start:
@@ -177,22 +512,21 @@ def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status):
 
         else:
             # No speech detected
-            if self.speech_started:
+            if speech_started:
                 # Add to buffer during silence (to capture end of speech)
                 self.buffer.extend(audio_chunk)
 
                 # Check if silence duration exceeded
                 silence_duration = current_time - self.last_speech_time
 
-                if silence_duration >= self.audio_config.silence_duration:
+                if silence_duration >= self._silence_duration_ns:
                     # Silence detected
-                    logger.debug(f"Silence detected after {silence_duration:.2f}s")
+                    logger.debug(f"Silence detected after {silence_duration / _NS_PER_SECOND:.2f}s")
 
                     if self._continuous_mode:
                         # In continuous mode, yield segment and reset for next
                         if len(self.buffer) >= self.min_speech_samples:
-                            self._current_segment = np.array(list(self.buffer), dtype=np.float32)
-                            self._segment_ready.set()
+                            self._segment_queue.put(self.buffer.to_array())
                         # Reset for next segment
                         self.buffer.clear()
                         self.speech_started = False
@@ -200,6 +534,7 @@ def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status):
                     else:
                         # Normal mode: stop recording
                         self.is_recording = False
+                        self._stop_recording.set()
 
             else:
                 # Still waiting for speech, add to pre-buffer
@@ -214,46 +549,55 @@ def record_until_silence(self) -> np.ndarray | None:
         # Reset state
         self.buffer.clear()
         self.pre_buffer.clear()
-        self.is_recording = True
         self.speech_started = False
-        self.last_speech_time = time.time()
-        self.recording_start_time = time.time()
+        self.recording_start_time = time.monotonic_ns()
+        self.last_speech_time = self.recording_start_time
+        self._stop_recording.clear()
 
-        # Ensure VAD model is loaded
+        # Ensure VAD model is loaded, starting from a fresh model state
         self._load_vad_model()
+        self._reset_vad_state()
 
         logger.info("Starting audio recording...")
 
+        # Only accept audio once the worker and its fresh queue are in place
+        self._start_vad_worker()
+        self.is_recording = True
+
         try:
-            # Open audio stream
-            with sd.InputStream(
-                samplerate=self.audio_config.sample_rate,
-                channels=self.audio_config.channels,
-                dtype=np.float32,
-                blocksize=self.audio_config.blocksize,
-                callback=self._audio_callback,
-            ):
-                # Wait until recording stops (silence detected or timeout)
-                while self.is_recording:
-                    time.sleep(0.1)
-
-                    # Check for timeout
-                    elapsed = time.time() - self.recording_start_time
-                    if elapsed >= self.audio_config.max_recording_duration:
-                        logger.warning(
-                            f"Max recording duration ({self.audio_config.max_recording_duration}s) reached"
-                        )
-                        break
-
-                    # Check minimum speech duration
-                    if not self.speech_started and elapsed > 5.0:
-                        logger.warning("No speech detected after 5s, stopping")
-                        return None
+            # Reuse the input stream: opening it costs far more than a chunk
+            self._ensure_stream()
+
+            # Wait until recording stops (silence detected or timeout),
+            # waking up only for the next deadline instead of polling
+            while not self._stop_recording.is_set():
+                # Check for timeout
+                elapsed = time.monotonic_ns() - self.recording_start_time
+                if elapsed >= self._max_recording_duration_ns:
+                    logger.warning(
+                        f"Max recording duration ({self.audio_config.max_recording_duration}s) reached"
+                    )
+                    break
+
+                # Check minimum speech duration
+                if not self.speech_started and elapsed >= _NO_SPEECH_TIMEOUT_NS:
+                    logger.warning("No speech detected after 5s, stopping")
+                    return None
+
+                deadline = self._max_recording_duration_ns
+                if not self.speech_started:
+                    deadline = min(deadline, _NO_SPEECH_TIMEOUT_NS)
+                self._stop_recording.wait((deadline - elapsed) / _NS_PER_SECOND)
 
         except Exception as e:
             logger.error(f"Audio recording failed: {e}")
+            self.close()
             return None
 
+        finally:
+            self.is_recording = False
+            self._stop_vad_worker()
+
         # Check if we have enough audio
         if len(self.buffer) < self.min_speech_samples:
             logger.warning(
@@ -261,8 +605,8 @@ def record_until_silence(self) -> np.ndarray | None:
             )
             return None
 
-        # Convert buffer to numpy array
-        audio_data = np.array(list(self.buffer), dtype=np.float32)
+        # Copy buffer out (it is reused by the next recording)
+        audio_data = self.buffer.to_array()
 
         recording_duration = len(audio_data) / self.audio_config.sample_rate
         logger.info(f"Recording complete: {recording_duration:.2f}s ({len(audio_data)} samples)")
@@ -282,57 +626,68 @@ def record_continuous(self) -> Iterator[np.ndarray]:
         # Reset state
         self.buffer.clear()
         self.pre_buffer.clear()
-        self.is_recording = True
         self.speech_started = False
-        self.last_speech_time = time.time()
-        self.recording_start_time = time.time()
+        self.recording_start_time = time.monotonic_ns()
+        self.last_speech_time = self.recording_start_time
 
         # Enable continuous mode
         self._continuous_mode = True
         self._stop_continuous.clear()
-        self._segment_ready.clear()
-        self._current_segment = None
+        self._segment_queue = queue.SimpleQueue()
 
-        # Ensure VAD model is loaded
+        # Ensure VAD model is loaded, starting from a fresh model state
         self._load_vad_model()
+        self._reset_vad_state()
 
         logger.info("Starting continuous recording...")
 
+        # Only accept audio once the worker and its fresh queue are in place
+        self._start_vad_worker()
+        self.is_recording = True
+
         try:
-            # Open audio stream
-            with sd.InputStream(
-                samplerate=self.audio_config.sample_rate,
-                channels=self.audio_config.channels,
-                dtype=np.float32,
-                blocksize=self.audio_config.blocksize,
-                callback=self._audio_callback,
-            ):
-                while not self._stop_continuous.is_set():
-                    # Wait for a segment to be ready or stop signal
-                    if self._segment_ready.wait(timeout=0.1):
-                        self._segment_ready.clear()
-
-                        if self._current_segment is not None:
-                            segment = self._current_segment
-                            self._current_segment = None
-
-                            duration = len(segment) / self.audio_config.sample_rate
-                            logger.info(f"Segment ready: {duration:.2f}s ({len(segment)} samples)")
-                            yield segment
-
-                # Yield any remaining audio in buffer
-                if len(self.buffer) >= self.min_speech_samples:
-                    final_segment = np.array(list(self.buffer), dtype=np.float32)
-                    duration = len(final_segment) / self.audio_config.sample_rate
-                    logger.info(f"Final segment: {duration:.2f}s ({len(final_segment)} samples)")
-                    yield final_segment
+            # Reuse the input stream: opening it costs far more than a chunk
+            self._ensure_stream()
+
+            while not self._stop_continuous.is_set():
+                # Wait for a segment to be ready or stop signal
+                try:
+                    segment = self._segment_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+                duration = len(segment) / self.audio_config.sample_rate
+                logger.info(f"Segment ready: {duration:.2f}s ({len(segment)} samples)")
+                yield segment
+
+            # Stop the VAD worker first: once it is joined, no segment can be
+            # queued and the buffer no longer changes under the reads below
+            self.is_recording = False
+            self._stop_vad_worker()
+
+            # Yield segments finished before the stop signal was seen
+            while True:
+                try:
+                    segment = self._segment_queue.get_nowait()
+                except queue.Empty:
+                    break
+                yield segment
+
+            # Yield any remaining audio in buffer
+            if len(self.buffer) >= self.min_speech_samples:
+                final_segment = self.buffer.to_array()
+                duration = len(final_segment) / self.audio_config.sample_rate
+                logger.info(f"Final segment: {duration:.2f}s ({len(final_segment)} samples)")
+                yield final_segment
 
         except Exception as e:
             logger.error(f"Continuous recording failed: {e}")
+            self.close()
 
         finally:
-            self._continuous_mode = False
             self.is_recording = False
+            self._stop_vad_worker()
+            self._continuous_mode = False
             logger.info("Continuous recording stopped")
 
     def stop_continuous(self) -> None:
@@ -358,7 +713,7 @@ def get_available_devices(self) -> list:
         Returns:
             List of device dictionaries
         """
-        devices = sd.query_devices()
+        devices = _query_devices()
         input_devices = [d for d in devices if d.get("max_input_channels", 0) > 0]
 
         return input_devices
@@ -369,6 +724,9 @@ def set_default_device(self, device_id: int | None = None):
         Args:
             device_id: Device ID, or None for system default
         """
+        # The open stream is bound to the previous device
+        self.close()
+
         if device_id is not None:
             sd.default.device = (device_id, sd.default.device[1])
             logger.info(f"Set default input device to: {device_id}")
@@ -383,11 +741,12 @@ def list_audio_devices():
     print("Available Audio Input Devices:")
     print("=" * 60)
 
-    devices = sd.query_devices()
+    devices = _query_devices()
+    default_input = sd.default.device[0]
 
     for i, device in enumerate(devices):
         if device["max_input_channels"] > 0:
-            default_marker = " [DEFAULT]" if i == sd.default.device[0] else ""
+            default_marker = " [DEFAULT]" if i == default_input else ""
             print(f"{i}: {device['name']}{default_marker}")
             print(f"   Channels: {device['max_input_channels']}")
             print(f"   Sample Rate: {device['default_samplerate']} Hz")
@@ -5,6 +5,7 @@
 import shutil
 import subprocess
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 from loguru import logger
 
@@ -50,21 +51,12 @@ class XdotoolPaster(BaseAutoPaster):
 
     def is_available(self) -> bool:
         """Check if xdotool is available and we're in X11."""
-        # Check if xdotool is installed
-        try:
-            result = subprocess.run(
-                ["which", "xdotool"],
-                capture_output=True,
-                timeout=1,
-                check=False,
-            )
-            if result.returncode != 0:
-                return False
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        # Check if we have a DISPLAY (X11 session)
+        if not os.environ.get("DISPLAY"):
             return False
 
-        # Check if we have a DISPLAY (X11 session)
-        return bool(os.environ.get("DISPLAY"))
+        # Check if xdotool is installed (in-process PATH lookup)
+        return shutil.which("xdotool") is not None
 
     def paste(self) -> bool:
         """Simulate Ctrl+V using xdotool."""
@@ -106,17 +98,8 @@ def __init__(self, timeout: float = 2.0, use_shift: bool = False):
 
     def is_available(self) -> bool:
         """Check if ydotool is available and daemon is running."""
-        # Check if ydotool is installed
-        try:
-            result = subprocess.run(
-                ["which", "ydotool"],
-                capture_output=True,
-                timeout=1,
-                check=False,
-            )
-            if result.returncode != 0:
-                return False
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        # Check if ydotool is installed (in-process PATH lookup)
+        if shutil.which("ydotool") is None:
             return False
 
         # Check if ydotoold daemon is running
@@ -176,21 +159,12 @@ class WtypePaster(BaseAutoPaster):
 
     def is_available(self) -> bool:
         """Check if wtype is available and we're in Wayland."""
-        # Check if wtype is installed
-        try:
-            result = subprocess.run(
-                ["which", "wtype"],
-                capture_output=True,
-                timeout=1,
-                check=False,
-            )
-            if result.returncode != 0:
-                return False
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        # Check if we have a WAYLAND_DISPLAY (Wayland session)
+        if not os.environ.get("WAYLAND_DISPLAY"):
             return False
 
-        # Check if we have a WAYLAND_DISPLAY (Wayland session)
-        return bool(os.environ.get("WAYLAND_DISPLAY"))
+        # Check if wtype is installed (in-process PATH lookup)
+        return shutil.which("wtype") is not None
 
     def paste(self) -> bool:
         """Paste text using wtype (types clipboard content directly).
@@ -279,6 +253,27 @@ def paste(self) -> bool:
             return False
 
 
+def _iter_candidate_tools(timeout: float = 2.0) -> Iterator[BaseAutoPaster]:
+    """Yield the paste tools that can work on this platform, in order of preference.
+
+    Tools are created lazily so callers can stop probing at the first available one.
+
+    Args:
+        timeout: Timeout for tool operations
+
+    Yields:
+        Paste tool instances (not yet checked for availability)
+    """
+    # osascript is the only option on macOS, and never available elsewhere
+    if platform.system() == "Darwin":
+        yield MacPaster(timeout)
+        return
+
+    yield XdotoolPaster(timeout)  # X11
+    yield YdotoolPaster(timeout)  # Universal
+    yield WtypePaster(timeout)  # Wayland, last resort
+
+
 def _detect_available_tools(timeout: float = 2.0) -> list[BaseAutoPaster]:
     """Detect which paste tools are available on the system.
 
@@ -290,29 +285,10 @@ def _detect_available_tools(timeout: float = 2.0) -> list[BaseAutoPaster]:
     """
     available: list[BaseAutoPaster] = []
 
-    # Try osascript (macOS) - check first as it's platform-specific
-    mac = MacPaster(timeout)
-    if mac.is_available():
-        available.append(mac)
-        logger.debug("osascript is available (macOS)")
-
-    # Try xdotool (X11)
-    xdotool = XdotoolPaster(timeout)
-    if xdotool.is_available():
-        available.append(xdotool)
-        logger.debug("xdotool is available")
-
-    # Try ydotool (universal)
-    ydotool = YdotoolPaster(timeout)
-    if ydotool.is_available():
-        available.append(ydotool)
-        logger.debug("ydotool is available")
-
-    # Try wtype (Wayland, last resort)
-    wtype = WtypePaster(timeout)
-    if wtype.is_available():
-        available.append(wtype)
-        logger.debug("wtype is available")
+    for tool in _iter_candidate_tools(timeout):
+        if tool.is_available():
+            available.append(tool)
+            logger.debug(f"{tool.__class__.__name__} is available")
 
     return available
 
@@ -355,15 +331,7 @@ def create_autopaster(
     Raises:
         RuntimeError: If no paste tool is available
     """
-    available_tools = _detect_available_tools(timeout)
-
-    if not available_tools:
-        raise RuntimeError(
-            "No auto-paste tool available. Please install xdotool (X11), "
-            "ydotool (universal), wtype (Wayland), or use osascript (macOS)"
-        )
-
-    # If preferred tool is specified, try to find it
+    # If preferred tool is specified, try it first
     if preferred_tool != "auto":
         tool_map = {
             "osascript": MacPaster,
@@ -374,20 +342,25 @@ def create_autopaster(
 
         preferred_class = tool_map.get(preferred_tool)
         if preferred_class:
-            # Check if this specific tool is available
-            for tool in available_tools:
-                if isinstance(tool, preferred_class):
-                    logger.info(f"Using preferred auto-paste tool: {preferred_tool}")
-                    return tool
+            tool = preferred_class(timeout)
+            if tool.is_available():
+                logger.info(f"Using preferred auto-paste tool: {preferred_tool}")
+                return tool
 
             logger.warning(
                 f"Preferred tool '{preferred_tool}' not available, falling back to auto-detection"
             )
 
-    # Return first available tool (highest priority)
-    tool = available_tools[0]
-    logger.info(f"Using auto-paste tool: {tool.__class__.__name__}")
-    return tool
+    # Return first available tool (highest priority), without probing the others
+    for tool in _iter_candidate_tools(timeout):
+        if tool.is_available():
+            logger.info(f"Using auto-paste tool: {tool.__class__.__name__}")
+            return tool
+
+    raise RuntimeError(
+        "No auto-paste tool available. Please install xdotool (X11), "
+        "ydotool (universal), wtype (Wayland), or use osascript (macOS)"
+    )
 
 
 # Convenience function for direct paste
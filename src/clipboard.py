@@ -1,5 +1,6 @@
 """Clipboard integration for Wayland, X11, and macOS."""
 
+import functools
 import os
 import platform
 import shutil
@@ -9,6 +10,19 @@
 from loguru import logger
 
 
+@functools.cache
+def _which(name: str) -> str | None:
+    """Locate a clipboard tool on PATH, searching once per process.
+
+    Args:
+        name: Executable name
+
+    Returns:
+        Path to the executable, or None if not found
+    """
+    return shutil.which(name)
+
+
 class BaseClipboardManager(ABC):
     """Base class for clipboard managers."""
 
@@ -64,7 +78,7 @@ def __init__(self, timeout: float = 2.0):
             RuntimeError: If wl-clipboard is not available
         """
         super().__init__(timeout)
-        if not shutil.which("wl-copy"):
+        if not _which("wl-copy"):
             raise RuntimeError(
                 "wl-copy not found. Please install wl-clipboard:\n  sudo apt install wl-clipboard"
             )
@@ -84,8 +98,8 @@ def copy(self, text: str) -> bool:
             return False
 
         try:
-            # Use wl-copy without waiting for it to exit
-            # wl-copy will fork to background and keep clipboard content available
+            # wl-copy reads the text, forks a background server that keeps the
+            # clipboard content available, then exits: wait only for that exit
             process = subprocess.Popen(
                 ["wl-copy"],
                 stdin=subprocess.PIPE,
@@ -97,16 +111,18 @@ def copy(self, text: str) -> bool:
             process.stdin.write(text.encode("utf-8"))
             process.stdin.close()
 
-            # Give it a moment to process
-            import time
-
-            time.sleep(0.1)
-
-            # Check if process had any immediate errors
-            if process.poll() is not None and process.returncode != 0:
-                stderr = process.stderr.read().decode("utf-8", errors="ignore").strip()
-                logger.error(f"wl-copy failed with code {process.returncode}: {stderr}")
-                return False
+            # wl-copy exits as soon as it has read the text and forked its
+            # background server, so wait for that instead of a fixed delay
+            try:
+                returncode = process.wait(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                # Still in the foreground but it has the text: keep it serving
+                logger.debug(f"wl-copy still running after {self.timeout}s")
+            else:
+                if returncode != 0:
+                    stderr = process.stderr.read().decode("utf-8", errors="ignore").strip()
+                    logger.error(f"wl-copy failed with code {returncode}: {stderr}")
+                    return False
 
             logger.info(f"Copied {len(text)} characters to clipboard (Wayland)")
             return True
@@ -123,15 +139,17 @@ def paste(self) -> str | None:
         """
         try:
             result = subprocess.run(
-                ["wl-paste"], capture_output=True, text=True, timeout=self.timeout, check=False
+                ["wl-paste"], capture_output=True, timeout=self.timeout, check=False
             )
 
             if result.returncode == 0:
-                text = result.stdout
+                # Decoded here (no text=True) so line endings are kept as copied
+                text = result.stdout.decode("utf-8", errors="replace")
                 logger.debug(f"Retrieved {len(text)} characters from clipboard")
                 return text
             else:
-                logger.error(f"wl-paste failed: {result.stderr}")
+                stderr = result.stderr.decode("utf-8", errors="ignore").strip()
+                logger.error(f"wl-paste failed: {stderr}")
                 return None
 
         except subprocess.TimeoutExpired:
@@ -181,10 +199,16 @@ def __init__(self, timeout: float = 2.0):
 
         # Check for xclip first (preferred), then xsel
         self.tool = None
-        if shutil.which("xclip"):
+        self._copy_cmd: tuple[str, ...]
+        self._paste_cmd: tuple[str, ...]
+        if _which("xclip"):
             self.tool = "xclip"
-        elif shutil.which("xsel"):
+            self._copy_cmd = ("xclip", "-selection", "clipboard")
+            self._paste_cmd = ("xclip", "-selection", "clipboard", "-o")
+        elif _which("xsel"):
             self.tool = "xsel"
+            self._copy_cmd = ("xsel", "--clipboard", "--input")
+            self._paste_cmd = ("xsel", "--clipboard", "--output")
         else:
             raise RuntimeError(
                 "Neither xclip nor xsel found. Please install one:\n"
@@ -209,15 +233,8 @@ def copy(self, text: str) -> bool:
             return False
 
         try:
-            if self.tool == "xclip":
-                # xclip -selection clipboard
-                cmd = ["xclip", "-selection", "clipboard"]
-            else:  # xsel
-                # xsel --clipboard --input
-                cmd = ["xsel", "--clipboard", "--input"]
-
             result = subprocess.run(
-                cmd,
+                self._copy_cmd,
                 input=text.encode("utf-8"),
                 capture_output=True,
                 timeout=self.timeout,
@@ -247,23 +264,17 @@ def paste(self) -> str | None:
             Clipboard text or None if failed
         """
         try:
-            if self.tool == "xclip":
-                # xclip -selection clipboard -o
-                cmd = ["xclip", "-selection", "clipboard", "-o"]
-            else:  # xsel
-                # xsel --clipboard --output
-                cmd = ["xsel", "--clipboard", "--output"]
-
             result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=self.timeout, check=False
+                self._paste_cmd, capture_output=True, timeout=self.timeout, check=False
             )
 
             if result.returncode == 0:
-                text = result.stdout
+                text = result.stdout.decode("utf-8", errors="replace")
                 logger.debug(f"Retrieved {len(text)} characters from clipboard")
                 return text
             else:
-                logger.error(f"{self.tool} paste failed: {result.stderr}")
+                stderr = result.stderr.decode("utf-8", errors="ignore").strip()
+                logger.error(f"{self.tool} paste failed: {stderr}")
                 return None
 
         except subprocess.TimeoutExpired:
@@ -302,7 +313,7 @@ def __init__(self, timeout: float = 2.0):
             RuntimeError: If pbcopy is not available (not on macOS)
         """
         super().__init__(timeout)
-        if not shutil.which("pbcopy"):
+        if not _which("pbcopy"):
             raise RuntimeError(
                 "pbcopy not found. This clipboard manager is only available on macOS."
             )
@@ -354,15 +365,16 @@ def paste(self) -> str | None:
         """
         try:
             result = subprocess.run(
-                ["pbpaste"], capture_output=True, text=True, timeout=self.timeout, check=False
+                ["pbpaste"], capture_output=True, timeout=self.timeout, check=False
             )
 
             if result.returncode == 0:
-                text = result.stdout
+                text = result.stdout.decode("utf-8", errors="replace")
                 logger.debug(f"Retrieved {len(text)} characters from clipboard")
                 return text
             else:
-                logger.error(f"pbpaste failed: {result.stderr}")
+                stderr = result.stderr.decode("utf-8", errors="ignore").strip()
+                logger.error(f"pbpaste failed: {stderr}")
                 return None
 
         except subprocess.TimeoutExpired:
@@ -444,18 +456,18 @@ def check_clipboard_tool() -> bool:
     session_type = detect_session_type()
 
     if session_type == "macos":
-        return shutil.which("pbcopy") is not None
+        return _which("pbcopy") is not None
     elif session_type == "wayland":
-        return shutil.which("wl-copy") is not None
+        return _which("wl-copy") is not None
     elif session_type == "x11":
-        return shutil.which("xclip") is not None or shutil.which("xsel") is not None
+        return _which("xclip") is not None or _which("xsel") is not None
     else:
         # Unknown session: check for any tool
         return (
-            shutil.which("pbcopy") is not None
-            or shutil.which("wl-copy") is not None
-            or shutil.which("xclip") is not None
-            or shutil.which("xsel") is not None
+            _which("pbcopy") is not None
+            or _which("wl-copy") is not None
+            or _which("xclip") is not None
+            or _which("xsel") is not None
         )
 
 
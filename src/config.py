@@ -1,6 +1,6 @@
 """Configuration management for STT Clipboard."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
 import yaml
@@ -9,8 +9,30 @@
 from src.clipboard import check_clipboard_tool
 from src.languages import SupportedLanguage
 
-
-@dataclass
+# libyaml-backed loader/dumper when PyYAML was built with it, pure Python otherwise
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Allowed values checked by Config.validate() (tuples keep the order shown in errors)
+_VALID_SAMPLE_RATES = frozenset({8000, 16000, 22050, 44100, 48000})
+_VALID_CHANNELS = frozenset({1, 2})
+_VALID_MODEL_SIZES = ("tiny", "base", "small", "medium", "large")
+_VALID_MODEL_SIZES_SET = frozenset(_VALID_MODEL_SIZES)
+_VALID_COMPUTE_TYPES = ("int8", "int16", "float16", "float32")
+_VALID_COMPUTE_TYPES_SET = frozenset(_VALID_COMPUTE_TYPES)
+_VALID_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS_SET = frozenset(_VALID_LOG_LEVELS)
+
+# Parsed YAML per resolved config path, with the (st_mtime_ns, st_size) it was read at.
+# Each from_yaml() call still builds a fresh Config, so callers may mutate it.
+_YAML_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
+
+
+@dataclass(slots=True)
 class AudioConfig:
     """Audio capture configuration."""
 
@@ -22,7 +44,7 @@ class AudioConfig:
     blocksize: int = 512
 
 
-@dataclass
+@dataclass(slots=True)
 class VADConfig:
     """Voice Activity Detection configuration."""
 
@@ -31,7 +53,7 @@ class VADConfig:
     speech_pad_ms: int = 300
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionConfig:
     """Transcription configuration."""
 
@@ -46,7 +68,7 @@ class TranscriptionConfig:
     streaming_enabled: bool = False  # Enable streaming transcription output
 
 
-@dataclass
+@dataclass(slots=True)
 class PunctuationConfig:
     """Punctuation post-processing configuration."""
 
@@ -54,7 +76,7 @@ class PunctuationConfig:
     french_spacing: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ClipboardConfig:
     """Clipboard configuration."""
 
@@ -65,7 +87,7 @@ class ClipboardConfig:
     max_delay: float = 2.0  # Maximum delay between retries
 
 
-@dataclass
+@dataclass(slots=True)
 class PasteConfig:
     """Auto-paste configuration."""
 
@@ -75,7 +97,7 @@ class PasteConfig:
     preferred_tool: str = "auto"  # "auto", "xdotool", "ydotool", "wtype"
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration."""
 
@@ -86,7 +108,7 @@ class LoggingConfig:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class HotkeyConfig:
     """Hotkey configuration."""
 
@@ -95,7 +117,7 @@ class HotkeyConfig:
     socket_path: str = "/tmp/stt-clipboard.sock"  # nosec B108
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoryConfig:
     """Transcription history configuration."""
 
@@ -103,9 +125,37 @@ class HistoryConfig:
     file: str = "./data/history.json"
     max_entries: int = 100
     auto_save: bool = True
+    flush_interval: float = 2.0  # Seconds without new entries before auto-saving (0 = every add)
+
+
+def _is_one_of(value: object, allowed: frozenset) -> bool:
+    """Check set membership, treating unhashable values (e.g. YAML lists) as invalid."""
+    try:
+        return value in allowed
+    except TypeError:
+        return False
+
+
+def _field_names(config_class: type) -> tuple[str, ...]:
+    """Return the field names of a config dataclass, in declaration order."""
+    return tuple(f.name for f in fields(config_class))
 
 
-@dataclass
+# (section, field names) of every Config sub-configuration, in declaration order
+_SECTION_FIELDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("audio", _field_names(AudioConfig)),
+    ("vad", _field_names(VADConfig)),
+    ("transcription", _field_names(TranscriptionConfig)),
+    ("punctuation", _field_names(PunctuationConfig)),
+    ("clipboard", _field_names(ClipboardConfig)),
+    ("paste", _field_names(PasteConfig)),
+    ("logging", _field_names(LoggingConfig)),
+    ("hotkey", _field_names(HotkeyConfig)),
+    ("history", _field_names(HistoryConfig)),
+)
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of system tools validation."""
 
@@ -114,7 +164,7 @@ class ValidationResult:
     warnings: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration class."""
 
@@ -147,8 +197,18 @@ def from_yaml(cls, config_path: str | None = None) -> "Config":
             # Return default config if file doesn't exist
             return cls()
 
-        with open(config_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        # Reuse the parsed file while it is unchanged on disk
+        stat = config_file.stat()
+        cache_key = str(config_file.resolve())
+        file_version = (stat.st_mtime_ns, stat.st_size)
+        cached = _YAML_CACHE.get(cache_key)
+
+        if cached is not None and cached[0] == file_version:
+            data = cached[1]
+        else:
+            # One read, then libyaml parses from memory instead of pulling the stream
+            data = yaml.load(config_file.read_bytes(), Loader=_YamlLoader) or {}
+            _YAML_CACHE[cache_key] = (file_version, data)
 
         # Parse each section
         audio_data = data.get("audio", {})
@@ -180,10 +240,10 @@ def validate(self) -> None:
             ValueError: If configuration is invalid
         """
         # Audio validation
-        if self.audio.sample_rate not in [8000, 16000, 22050, 44100, 48000]:
+        if not _is_one_of(self.audio.sample_rate, _VALID_SAMPLE_RATES):
             raise ValueError(f"Invalid sample_rate: {self.audio.sample_rate}")
 
-        if self.audio.channels not in [1, 2]:
+        if not _is_one_of(self.audio.channels, _VALID_CHANNELS):
             raise ValueError(f"Invalid channels: {self.audio.channels}")
 
         if self.audio.silence_duration <= 0:
@@ -199,16 +259,16 @@ def validate(self) -> None:
             raise ValueError(f"VAD threshold must be between 0 and 1: {self.vad.threshold}")
 
         # Transcription validation
-        valid_models = ["tiny", "base", "small", "medium", "large"]
-        if self.transcription.model_size not in valid_models:
+        if not _is_one_of(self.transcription.model_size, _VALID_MODEL_SIZES_SET):
             raise ValueError(
-                f"Invalid model_size: {self.transcription.model_size}. Must be one of {valid_models}"
+                f"Invalid model_size: {self.transcription.model_size}. "
+                f"Must be one of {list(_VALID_MODEL_SIZES)}"
             )
 
-        valid_compute_types = ["int8", "int16", "float16", "float32"]
-        if self.transcription.compute_type not in valid_compute_types:
+        if not _is_one_of(self.transcription.compute_type, _VALID_COMPUTE_TYPES_SET):
             raise ValueError(
-                f"Invalid compute_type: {self.transcription.compute_type}. Must be one of {valid_compute_types}"
+                f"Invalid compute_type: {self.transcription.compute_type}. "
+                f"Must be one of {list(_VALID_COMPUTE_TYPES)}"
             )
 
         if self.transcription.beam_size < 1:
@@ -224,10 +284,10 @@ def validate(self) -> None:
                 )
 
         # Logging validation
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.logging.level.upper() not in valid_levels:
+        if self.logging.level.upper() not in _VALID_LOG_LEVELS_SET:
             raise ValueError(
-                f"Invalid logging level: {self.logging.level}. Must be one of {valid_levels}"
+                f"Invalid logging level: {self.logging.level}. "
+                f"Must be one of {list(_VALID_LOG_LEVELS)}"
             )
 
     def validate_system_tools(self) -> ValidationResult:
@@ -267,64 +327,11 @@ def to_dict(self) -> dict:
         Returns:
             Dictionary representation of config
         """
-        return {
-            "audio": {
-                "sample_rate": self.audio.sample_rate,
-                "channels": self.audio.channels,
-                "silence_duration": self.audio.silence_duration,
-                "min_speech_duration": self.audio.min_speech_duration,
-                "max_recording_duration": self.audio.max_recording_duration,
-                "blocksize": self.audio.blocksize,
-            },
-            "vad": {
-                "threshold": self.vad.threshold,
-                "min_silence_duration_ms": self.vad.min_silence_duration_ms,
-                "speech_pad_ms": self.vad.speech_pad_ms,
-            },
-            "transcription": {
-                "model_size": self.transcription.model_size,
-                "language": self.transcription.language,
-                "device": self.transcription.device,
-                "compute_type": self.transcription.compute_type,
-                "beam_size": self.transcription.beam_size,
-                "best_of": self.transcription.best_of,
-                "temperature": self.transcription.temperature,
-                "download_root": self.transcription.download_root,
-                "streaming_enabled": self.transcription.streaming_enabled,
-            },
-            "punctuation": {
-                "enabled": self.punctuation.enabled,
-                "french_spacing": self.punctuation.french_spacing,
-            },
-            "clipboard": {
-                "enabled": self.clipboard.enabled,
-                "timeout": self.clipboard.timeout,
-                "max_retries": self.clipboard.max_retries,
-                "backoff_base": self.clipboard.backoff_base,
-                "max_delay": self.clipboard.max_delay,
-            },
-            "paste": {
-                "enabled": self.paste.enabled,
-                "timeout": self.paste.timeout,
-                "delay_ms": self.paste.delay_ms,
-                "preferred_tool": self.paste.preferred_tool,
-            },
-            "logging": {
-                "level": self.logging.level,
-                "file": self.logging.file,
-                "format": self.logging.format,
-            },
-            "hotkey": {
-                "enabled": self.hotkey.enabled,
-                "socket_path": self.hotkey.socket_path,
-            },
-            "history": {
-                "enabled": self.history.enabled,
-                "file": self.history.file,
-                "max_entries": self.history.max_entries,
-                "auto_save": self.history.auto_save,
-            },
-        }
+        result = {}
+        for section, names in _SECTION_FIELDS:
+            sub_config = getattr(self, section)
+            result[section] = {name: getattr(sub_config, name) for name in names}
+        return result
 
     def save_to_yaml(self, config_path: str) -> None:
         """Save configuration to YAML file.
@@ -333,7 +340,16 @@ def save_to_yaml(self, config_path: str) -> None:
             config_path: Path to save config file
         """
         config_file = Path(config_path)
-        config_file.parent.mkdir(parents=True, exist_ok=True)
+        # A single stat in the usual case, instead of a failing mkdir plus a stat
+        if not config_file.parent.is_dir():
+            config_file.parent.mkdir(parents=True, exist_ok=True)
 
         with open(config_file, "w", encoding="utf-8") as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(
+                self.to_dict(),
+                f,
+                Dumper=_YamlDumper,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+            )
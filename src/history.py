@@ -1,15 +1,20 @@
 """Transcription history management for STT Clipboard."""
 
+import atexit
 import json
+import os
+import stat
 import threading
-from dataclasses import asdict, dataclass
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionEntry:
     """A single transcription history entry."""
 
@@ -48,7 +53,14 @@ def create(
 
     def to_dict(self) -> dict:
         """Convert entry to dictionary."""
-        return asdict(self)
+        # Flat scalar fields: no need for asdict()'s recursive deep copy
+        return {
+            "text": self.text,
+            "timestamp": self.timestamp,
+            "language": self.language,
+            "audio_duration": self.audio_duration,
+            "transcription_time": self.transcription_time,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "TranscriptionEntry":
@@ -77,6 +89,8 @@ def __init__(
         history_file: str | Path | None = None,
         max_entries: int = 100,
         auto_save: bool = True,
+        flush_interval: float = 0.0,
+        flush_batch_size: int = 10,
     ):
         """Initialize transcription history.
 
@@ -84,13 +98,31 @@ def __init__(
             history_file: Path to history file. None disables persistence.
             max_entries: Maximum number of entries to keep (FIFO)
             auto_save: Whether to save after each add
+            flush_interval: With auto_save, seconds without a new entry before
+                pending entries are saved. 0 saves after every add.
+            flush_batch_size: With a flush interval, save as soon as this many
+                entries are pending
         """
         self.history_file = Path(history_file) if history_file else None
         self.max_entries = max_entries
         self.auto_save = auto_save
-        self._entries: list[TranscriptionEntry] = []
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        # Bounded FIFO: appending past max_entries drops the oldest entry
+        self._entries: deque[TranscriptionEntry] = deque(maxlen=max_entries)
+        # Immutable copy of the entries served to readers without locking.
+        # Writers (add, clear, load) only mark it stale (None) under the lock;
+        # the first read after a write rebuilds it, so adds never pay the copy
+        self._snapshot: tuple[TranscriptionEntry, ...] | None = ()
         self._lock = threading.Lock()
 
+        # Batched auto-save: entries added since the last save, and the timer
+        # that saves them once adds stop for flush_interval seconds
+        self._pending_writes = 0
+        self._flush_timer: threading.Timer | None = None
+        if self.auto_save and self.history_file and self.flush_interval > 0:
+            atexit.register(self.flush)
+
         # Load existing history
         if self.history_file and self.history_file.exists():
             self._load()
@@ -127,15 +159,20 @@ def add(
 
         with self._lock:
             self._entries.append(entry)
-
-            # Trim to max entries (FIFO)
-            if len(self._entries) > self.max_entries:
-                self._entries = self._entries[-self.max_entries :]
+            self._snapshot = None
 
             if self.auto_save and self.history_file:
-                self._save_unlocked()
-
-        logger.debug(f"Added to history: '{text[:50]}...' ({len(self._entries)} total)")
+                if self.flush_interval > 0:
+                    self._schedule_flush_unlocked()
+                else:
+                    self._save_unlocked()
+
+        # Lazy: the preview is only built when DEBUG is actually logged
+        logger.opt(lazy=True).debug(
+            "Added to history: '{}...' ({} total)",
+            lambda: text[:50],
+            lambda: len(self._entries),
+        )
         return entry
 
     def get_recent(self, count: int = 10) -> list[TranscriptionEntry]:
@@ -147,8 +184,7 @@ def get_recent(self, count: int = 10) -> list[TranscriptionEntry]:
         Returns:
             List of most recent entries (newest first)
         """
-        with self._lock:
-            return list(reversed(self._entries[-count:]))
+        return list(islice(reversed(self._get_snapshot()), count))
 
     def get_all(self) -> list[TranscriptionEntry]:
         """Get all transcriptions.
@@ -156,8 +192,7 @@ def get_all(self) -> list[TranscriptionEntry]:
         Returns:
             List of all entries (oldest first)
         """
-        with self._lock:
-            return list(self._entries)
+        return list(self._get_snapshot())
 
     def search(self, query: str, limit: int = 10) -> list[TranscriptionEntry]:
         """Search transcriptions containing query text.
@@ -170,9 +205,9 @@ def search(self, query: str, limit: int = 10) -> list[TranscriptionEntry]:
             List of matching entries (newest first)
         """
         query_lower = query.lower()
-        with self._lock:
-            results = [e for e in reversed(self._entries) if query_lower in e.text.lower()]
-            return results[:limit]
+        # Lazy filter: stops scanning as soon as limit matches are found
+        matches = (e for e in reversed(self._get_snapshot()) if query_lower in e.text.lower())
+        return list(islice(matches, limit))
 
     def clear(self) -> int:
         """Clear all history entries.
@@ -183,6 +218,7 @@ def clear(self) -> int:
         with self._lock:
             count = len(self._entries)
             self._entries.clear()
+            self._snapshot = ()
             if self.auto_save and self.history_file:
                 self._save_unlocked()
         logger.info(f"Cleared {count} history entries")
@@ -190,8 +226,22 @@ def clear(self) -> int:
 
     def __len__(self) -> int:
         """Return number of entries in history."""
-        with self._lock:
-            return len(self._entries)
+        # len() of a deque is atomic: no lock and no snapshot needed
+        return len(self._entries)
+
+    def _get_snapshot(self) -> tuple[TranscriptionEntry, ...]:
+        """Return the entries as an immutable tuple, rebuilding it if stale.
+
+        Only the first read after a write takes the lock (to copy the deque
+        while no writer mutates it); later reads return the cached tuple.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = tuple(self._entries)
+                snapshot = self._snapshot
+        return snapshot
 
     def _load(self) -> None:
         """Load history from file."""
@@ -202,20 +252,21 @@ def _load(self) -> None:
             with open(self.history_file, encoding="utf-8") as f:
                 data = json.load(f)
 
-            self._entries = [TranscriptionEntry.from_dict(e) for e in data.get("entries", [])]
-
-            # Trim if needed
-            if len(self._entries) > self.max_entries:
-                self._entries = self._entries[-self.max_entries :]
+            # Keeps only the newest max_entries
+            self._entries = deque(
+                (TranscriptionEntry.from_dict(e) for e in data.get("entries", [])),
+                maxlen=self.max_entries,
+            )
+            self._snapshot = None
 
             logger.info(f"Loaded {len(self._entries)} history entries from {self.history_file}")
 
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse history file: {e}")
-            self._entries = []
+            self._entries.clear()
         except Exception as e:
             logger.error(f"Failed to load history: {e}")
-            self._entries = []
+            self._entries.clear()
 
     def _save_unlocked(self) -> None:
         """Save history to file (caller must hold lock)."""
@@ -231,10 +282,43 @@ def _save_unlocked(self) -> None:
                 "entries": [e.to_dict() for e in self._entries],
             }
 
-            with open(self.history_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-
-            logger.debug(f"Saved {len(self._entries)} entries to {self.history_file}")
+            # One-shot dumps() without indent runs on the C encoder; json.dump()
+            # and indented output always go through the pure-Python one.
+            # Written to a sibling file then renamed over the history file, so a
+            # crash mid-write leaves the previous history intact.
+            payload = json.dumps(data, ensure_ascii=False)
+            # Replace the file a symlinked history.json points to, not the link
+            target = self.history_file.resolve()
+            tmp_file = target.with_name(target.name + ".tmp")
+
+            # The renamed file replaces the old one, mode included: carry over
+            # the current mode (transcripts are private by default)
+            try:
+                mode = stat.S_IMODE(target.stat().st_mode)
+            except FileNotFoundError:
+                mode = 0o600
+
+            try:
+                fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    os.fchmod(f.fileno(), mode)  # Not narrowed by the umask
+                    f.write(payload)
+                os.replace(tmp_file, target)
+            except Exception:
+                # e.g. disk full: drop the partial file, the old history is intact
+                tmp_file.unlink(missing_ok=True)
+                raise
+
+            # Everything in memory is on disk: nothing is pending anymore. On a
+            # failed save entries stay pending, so a later flush retries them.
+            self._pending_writes = 0
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            logger.opt(lazy=True).debug(
+                "Saved {} entries to {}", lambda: len(self._entries), lambda: self.history_file
+            )
 
         except Exception as e:
             logger.error(f"Failed to save history: {e}")
@@ -244,9 +328,47 @@ def save(self) -> None:
         with self._lock:
             self._save_unlocked()
 
+    def flush(self) -> None:
+        """Save entries still waiting for a batched auto-save, if any."""
+        with self._lock:
+            if self._pending_writes:
+                self._save_unlocked()
+
+    def close(self) -> None:
+        """Save pending entries and stop batched saving.
+
+        Call before replacing this instance with another one on the same file:
+        no timer or exit hook of this instance writes to the file afterwards.
+        """
+        atexit.unregister(self.flush)
+        with self._lock:
+            if self._pending_writes:
+                self._save_unlocked()
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+    def _schedule_flush_unlocked(self) -> None:
+        """Count a pending entry and save now or (re)arm the flush timer.
+
+        Caller must hold lock.
+        """
+        self._pending_writes += 1
+
+        if self._pending_writes >= self.flush_batch_size:
+            self._save_unlocked()
+            return
+
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
 
 # Global history instance
 _history: TranscriptionHistory | None = None
+_history_lock = threading.Lock()
 
 
 def get_history(
@@ -263,9 +385,12 @@ def get_history(
         TranscriptionHistory instance
     """
     global _history
+    # Double-checked: once created, callers return without taking the lock
     if _history is None:
-        _history = TranscriptionHistory(
-            history_file=history_file,
-            max_entries=max_entries,
-        )
+        with _history_lock:
+            if _history is None:
+                _history = TranscriptionHistory(
+                    history_file=history_file,
+                    max_entries=max_entries,
+                )
     return _history
@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import socket
 from collections.abc import Awaitable, Callable
 from enum import Enum
 from pathlib import Path
@@ -18,6 +19,17 @@ class TriggerType(Enum):
     UNKNOWN = "TRIGGER"  # Legacy support
 
 
+# Trigger messages are short ASCII tokens; cap the server's line buffer accordingly
+_MAX_MESSAGE_SIZE = 128
+
+# Wire message -> trigger type; anything else falls back to TriggerType.UNKNOWN
+_TRIGGER_MAP: dict[bytes, TriggerType] = {
+    b"TRIGGER_COPY": TriggerType.COPY,
+    b"TRIGGER_PASTE": TriggerType.PASTE,
+    b"TRIGGER_PASTE_TERMINAL": TriggerType.PASTE_TERMINAL,
+}
+
+
 class TriggerServer:
     """Unix socket server for receiving trigger events from hotkey."""
 
@@ -50,23 +62,28 @@ async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.Str
         logger.debug(f"Client connected: {addr}")
 
         try:
-            # Read trigger message
-            data = await reader.read(100)
-            message = data.decode("utf-8").strip()
-
-            logger.debug(f"Received trigger: {message}")
-
-            # Parse trigger type
-            if message == "TRIGGER_COPY":
-                trigger_type = TriggerType.COPY
-            elif message == "TRIGGER_PASTE":
-                trigger_type = TriggerType.PASTE
-            elif message == "TRIGGER_PASTE_TERMINAL":
-                trigger_type = TriggerType.PASTE_TERMINAL
-            else:
+            # Read one newline-terminated trigger message
+            try:
+                data = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                # Client closed without a trailing newline
+                data = e.partial
+            except asyncio.LimitOverrunError:
+                # Oversized message: cannot be a known trigger
+                data = b""
+            message = data.strip()
+
+            # Parse trigger type (tokens are ASCII, so match on the raw bytes)
+            trigger_type = _TRIGGER_MAP.get(message)
+            if trigger_type is None:
                 # Legacy support: treat "TRIGGER" and unknown messages as COPY
                 trigger_type = TriggerType.UNKNOWN
-                logger.debug(f"Unknown trigger message '{message}', treating as legacy TRIGGER")
+                logger.opt(lazy=True).debug(
+                    "Unknown trigger message '{}', treating as legacy TRIGGER",
+                    lambda: message.decode("utf-8", errors="replace"),
+                )
+            else:
+                logger.opt(lazy=True).debug("Received trigger: {}", lambda: trigger_type.value)
 
             # Call trigger callback with type
             if self.on_trigger:
@@ -114,7 +131,7 @@ async def start(self):
         try:
             # Create Unix socket server
             self.server = await asyncio.start_unix_server(
-                self._handle_client, path=self.socket_path
+                self._handle_client, path=self.socket_path, limit=_MAX_MESSAGE_SIZE
             )
 
             # Set socket permissions (readable/writable by user)
@@ -222,7 +239,10 @@ async def send_trigger(self, trigger_type: str = "TRIGGER", timeout: float = 2.0
             await writer.drain()
 
             # Wait for response
-            response = await asyncio.wait_for(reader.read(100), timeout=timeout)
+            try:
+                response = await asyncio.wait_for(reader.readuntil(b"\n"), timeout=timeout)
+            except asyncio.IncompleteReadError as e:
+                response = e.partial
             response_text = response.decode("utf-8").strip()
 
             logger.debug(f"Server response: {response_text}")
@@ -256,7 +276,52 @@ def send_trigger_sync(self, trigger_type: str = "TRIGGER", timeout: float = 2.0)
         Returns:
             True if successful, False otherwise
         """
-        return asyncio.run(self.send_trigger(trigger_type, timeout))
+        return self._send_trigger_blocking(trigger_type, timeout)
+
+    def _send_trigger_blocking(self, trigger_type: str, timeout: float) -> bool:
+        """Send trigger over a blocking socket, without starting an event loop.
+
+        Args:
+            trigger_type: Type of trigger to send
+            timeout: Timeout applied to each socket operation
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(timeout)
+                sock.connect(self.socket_path)
+
+                # Send trigger message
+                sock.sendall(f"{trigger_type}\n".encode())
+
+                # Wait for response (one newline-terminated line)
+                response = b""
+                while b"\n" not in response:
+                    chunk = sock.recv(256)
+                    if not chunk:
+                        break
+                    response += chunk
+
+            response_text = response.decode("utf-8").strip()
+
+            logger.debug(f"Server response: {response_text}")
+
+            return response_text == "OK"
+
+        except FileNotFoundError:
+            logger.error(f"Socket not found: {self.socket_path}")
+            logger.error("Is the STT service running?")
+            return False
+
+        except TimeoutError:
+            logger.error(f"Connection timeout after {timeout}s")
+            return False
+
+        except Exception as e:
+            logger.error(f"Failed to send trigger: {e}")
+            return False
 
 
 # Convenience functions
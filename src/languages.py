@@ -1,8 +1,13 @@
 """Language configuration and rules for STT Clipboard."""
 
+import functools
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Matches nothing; used when a rule list is empty
+_NEVER_MATCH = re.compile(r"(?!)")
+
 
 class SupportedLanguage(Enum):
     """Supported languages for transcription and post-processing."""
@@ -26,11 +31,7 @@ def from_code(cls, code: str | None) -> "SupportedLanguage | None":
         if code is None:
             return None
 
-        code = code.lower()
-        for lang in cls:
-            if lang.value == code:
-                return lang
-        return None
+        return _LANGUAGES_BY_CODE.get(code.lower())
 
     @classmethod
     def is_supported(cls, code: str | None) -> bool:
@@ -54,6 +55,10 @@ def all_codes(cls) -> list[str]:
         return [lang.value for lang in cls]
 
 
+# ISO 639-1 code -> language, built once for O(1) from_code() lookups
+_LANGUAGES_BY_CODE: dict[str, SupportedLanguage] = {lang.value: lang for lang in SupportedLanguage}
+
+
 @dataclass
 class LanguageRules:
     """Typography and processing rules for a language."""
@@ -72,6 +77,23 @@ class LanguageRules:
     # Whether to capitalize after sentence-ending punctuation
     capitalize_after_sentence: bool = True
 
+    # Compiled from the lists above in __post_init__
+    filler_pattern: re.Pattern[str] = field(init=False, repr=False, compare=False)
+    no_space_pattern: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compile the filler and punctuation lists into single-pass patterns."""
+        # Longest first so multi-word fillers win over their prefixes
+        fillers = sorted(self.filler_words, key=len, reverse=True)
+        self.filler_pattern = (
+            re.compile(rf"\b(?:{'|'.join(map(re.escape, fillers))})\b", re.IGNORECASE)
+            if fillers
+            else _NEVER_MATCH
+        )
+
+        no_space = "".join(re.escape(p) for p in self.no_space_before_punctuation)
+        self.no_space_pattern = re.compile(rf"\s+([{no_space}])") if no_space else _NEVER_MATCH
+
 
 # Language-specific rules
 LANGUAGE_RULES: dict[SupportedLanguage, LanguageRules] = {
@@ -108,6 +130,7 @@ class LanguageRules:
 }
 
 
+@functools.lru_cache(maxsize=16)
 def get_language_rules(language_code: str | None) -> LanguageRules:
     """Get rules for a specific language.
 
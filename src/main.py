@@ -75,6 +75,7 @@ def __init__(self, config: Config):
                 history_file=config.history.file,
                 max_entries=config.history.max_entries,
                 auto_save=config.history.auto_save,
+                flush_interval=config.history.flush_interval,
             )
             logger.info(
                 f"History enabled: {config.history.file} (max {config.history.max_entries})"
@@ -395,6 +396,10 @@ async def shutdown(self):
         if self.trigger_server:
             await self.trigger_server.stop()
 
+        # Write history entries still waiting for a batched save
+        if self.history:
+            self.history.flush()
+
         # Print stats
         logger.info("\n" + "=" * 60)
         logger.info("Session Statistics:")
@@ -53,8 +53,7 @@ def apply_punctuation_rules(
         text = re.sub(r"\s+([?!:;])", r"\1", text)
 
     # Remove space before commas and periods (universal rule)
-    no_space_pattern = "".join(re.escape(p) for p in rules.no_space_before_punctuation)
-    text = re.sub(rf"\s+([{no_space_pattern}])", r"\1", text)
+    text = rules.no_space_pattern.sub(r"\1", text)
 
     # Handle quotes based on language
     if rules.opening_quote == "\u00ab":  # French-style « »
@@ -123,9 +122,8 @@ def clean_whisper_artifacts(text: str, detected_language: str | None = None) ->
     effective_language = detected_language if detected_language else "fr"
     rules = get_language_rules(effective_language)
 
-    # Remove filler words from the language rules
-    for filler in rules.filler_words:
-        text = re.sub(rf"\b{re.escape(filler)}\b", "", text, flags=re.IGNORECASE)
+    # Remove filler words from the language rules in a single pass
+    text = rules.filler_pattern.sub("", text)
 
     # Remove extra whitespace
     text = re.sub(r"\s+", " ", text)
@@ -309,6 +309,7 @@ def __init__(self, config: Config, config_path: str = "config/config.yaml") -> N
                 history_file=config.history.file,
                 max_entries=config.history.max_entries,
                 auto_save=config.history.auto_save,
+                flush_interval=config.history.flush_interval,
             )
 
         # State
@@ -456,12 +457,19 @@ def reload_config(self, new_config: Config) -> None:
             new_config.history.enabled != old_config.history.enabled
             or new_config.history.file != old_config.history.file
             or new_config.history.max_entries != old_config.history.max_entries
+            or new_config.history.auto_save != old_config.history.auto_save
+            or new_config.history.flush_interval != old_config.history.flush_interval
         ):
+            # Write out pending entries before another instance loads the file
+            if self.history is not None:
+                self.history.close()
+
             if new_config.history.enabled:
                 self.history = TranscriptionHistory(
                     history_file=new_config.history.file,
                     max_entries=new_config.history.max_entries,
                     auto_save=new_config.history.auto_save,
+                    flush_interval=new_config.history.flush_interval,
                 )
             else:
                 self.history = None
@@ -719,6 +719,7 @@ def get_config(self) -> HistoryConfig:
             file=values["file"],
             max_entries=values["max_entries"],
             auto_save=values["auto_save"],
+            flush_interval=self.config.flush_interval,
         )
 
     def set_values(self, values: dict[str, Any]) -> None:
@@ -3,5 +3,26 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src to path for all tests
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.audio_capture import _VAD_MODEL_CACHE  # noqa: E402
+from src.clipboard import _which  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clear_which_cache():
+    """Drop cached tool lookups so each test sees its own shutil.which mock."""
+    _which.cache_clear()
+    yield
+    _which.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_vad_model_cache():
+    """Drop the process-wide VAD model so each test loads its own mock."""
+    _VAD_MODEL_CACHE.clear()
+    yield
+    _VAD_MODEL_CACHE.clear()
@@ -1,16 +1,92 @@
 #!/usr/bin/env python3
 """Tests for audio capture module."""
 
-import collections
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
 
-from src.audio_capture import AudioRecorder
+from src.audio_capture import (
+    _ENERGY_GATE_WARMUP_CHUNKS,
+    AudioRecorder,
+    AudioRingBuffer,
+    _query_devices,
+)
 from src.config import AudioConfig, VADConfig
 
 
+@pytest.fixture(autouse=True)
+def clear_device_cache():
+    """Drop the cached device list so each test sees its own mock."""
+    _query_devices.cache_clear()
+    yield
+    _query_devices.cache_clear()
+
+
+class TestAudioRingBuffer:
+    """Tests for the NumPy-backed audio ring buffer."""
+
+    def test_starts_empty(self):
+        """Test new buffer is empty."""
+        buffer = AudioRingBuffer(10)
+
+        assert len(buffer) == 0
+        assert not buffer
+        assert buffer.maxlen == 10
+        assert buffer.to_array().size == 0
+
+    def test_extend_preserves_order(self):
+        """Test samples are returned oldest first."""
+        buffer = AudioRingBuffer(10)
+
+        buffer.extend(np.array([1, 2, 3], dtype=np.float32))
+        buffer.extend(np.array([4, 5], dtype=np.float32))
+
+        assert len(buffer) == 5
+        np.testing.assert_array_equal(buffer.to_array(), [1, 2, 3, 4, 5])
+
+    def test_overwrites_oldest_samples_when_full(self):
+        """Test wrap-around drops the oldest samples like deque(maxlen=...)."""
+        buffer = AudioRingBuffer(5)
+
+        buffer.extend(np.arange(4, dtype=np.float32))
+        buffer.extend(np.arange(4, 7, dtype=np.float32))
+
+        assert len(buffer) == 5
+        np.testing.assert_array_equal(buffer.to_array(), [2, 3, 4, 5, 6])
+
+    def test_extend_larger_than_capacity_keeps_tail(self):
+        """Test extending with more than maxlen samples keeps the most recent."""
+        buffer = AudioRingBuffer(4)
+
+        buffer.extend(np.arange(10, dtype=np.float32))
+
+        np.testing.assert_array_equal(buffer.to_array(), [6, 7, 8, 9])
+
+    def test_to_array_returns_copy(self):
+        """Test returned array does not alias the backing storage."""
+        buffer = AudioRingBuffer(4)
+        buffer.extend(np.ones(2, dtype=np.float32))
+
+        data = buffer.to_array()
+        buffer.clear()
+        buffer.extend(np.zeros(2, dtype=np.float32))
+
+        np.testing.assert_array_equal(data, [1, 1])
+        assert data.dtype == np.float32
+
+    def test_clear_resets_buffer(self):
+        """Test clear empties the buffer."""
+        buffer = AudioRingBuffer(4)
+        buffer.extend(np.ones(6, dtype=np.float32))
+
+        buffer.clear()
+
+        assert len(buffer) == 0
+        buffer.extend(np.array([7], dtype=np.float32))
+        np.testing.assert_array_equal(buffer.to_array(), [7])
+
+
 class TestAudioRecorderInit:
     """Tests for AudioRecorder initialization."""
 
@@ -105,14 +181,32 @@ def test_loads_vad_model(self, mock_torch_load: MagicMock):
         recorder._load_vad_model()
 
         assert recorder.vad_model == mock_model
-        mock_model.eval.assert_called_once()
         mock_torch_load.assert_called_once_with(
-            repo_or_dir="snakers4/silero-vad",
+            repo_or_dir="snakers4/silero-vad:master",
             model="silero_vad",
             force_reload=False,
-            onnx=False,
+            onnx=True,
+            force_onnx_cpu=True,
         )
 
+    @patch("src.audio_capture.torch.hub.load")
+    def test_warms_up_model_and_resets_state(self, mock_torch_load: MagicMock):
+        """Test the model runs silent warm-up windows and its state is reset."""
+        mock_model = MagicMock()
+        mock_torch_load.return_value = (mock_model, None)
+
+        audio_config = AudioConfig()
+        vad_config = VADConfig()
+        recorder = AudioRecorder(audio_config, vad_config)
+
+        recorder._load_vad_model()
+
+        assert mock_model.call_count == 3
+        for call in mock_model.call_args_list:
+            assert call.args[0] is recorder._vad_input
+        assert not recorder._vad_input.any()
+        mock_model.reset_states.assert_called_once()
+
     @patch("src.audio_capture.torch.hub.load")
     def test_does_not_reload_if_already_loaded(self, mock_torch_load: MagicMock):
         """Test model is not reloaded if already loaded."""
@@ -128,6 +222,24 @@ def test_does_not_reload_if_already_loaded(self, mock_torch_load: MagicMock):
 
         assert mock_torch_load.call_count == 1
 
+    @patch("src.audio_capture.torch.hub.load")
+    def test_shares_model_across_recorders(self, mock_torch_load: MagicMock):
+        """Test the model is loaded and warmed up once per process."""
+        mock_model = MagicMock()
+        mock_torch_load.return_value = (mock_model, None)
+
+        audio_config = AudioConfig()
+        vad_config = VADConfig()
+        first = AudioRecorder(audio_config, vad_config)
+        second = AudioRecorder(audio_config, vad_config)
+
+        first._load_vad_model()
+        second._load_vad_model()
+
+        assert mock_torch_load.call_count == 1
+        assert second.vad_model is first.vad_model
+        assert mock_model.call_count == 3  # Warm-up passes only
+
     @patch("src.audio_capture.torch.hub.load")
     def test_raises_error_on_load_failure(self, mock_torch_load: MagicMock):
         """Test RuntimeError is raised on load failure."""
@@ -160,9 +272,21 @@ def test_detects_speech(self, mock_torch_load: MagicMock):
 
         assert prob == 0.95
 
+    def test_requires_float32_audio(self):
+        """Test int16 audio must be converted before reaching VAD."""
+        audio_config = AudioConfig()
+        vad_config = VADConfig()
+        recorder = AudioRecorder(audio_config, vad_config)
+        recorder.vad_model = MagicMock()
+
+        with pytest.raises(TypeError, match="float32"):
+            recorder._detect_speech(np.zeros(512, dtype=np.int16))
+
+        recorder.vad_model.assert_not_called()
+
     @patch("src.audio_capture.torch.hub.load")
-    def test_converts_int16_to_float32(self, mock_torch_load: MagicMock):
-        """Test int16 audio is converted to float32."""
+    def test_does_not_rescale_float_audio(self, mock_torch_load: MagicMock):
+        """Test float32 audio is passed to VAD without a range-based rescale."""
         mock_model = MagicMock()
         mock_model.return_value.item.return_value = 0.5
         mock_torch_load.return_value = (mock_model, None)
@@ -171,15 +295,69 @@ def test_converts_int16_to_float32(self, mock_torch_load: MagicMock):
         vad_config = VADConfig()
         recorder = AudioRecorder(audio_config, vad_config)
 
-        audio_chunk = np.zeros(512, dtype=np.int16)
+        audio_chunk = np.tile(np.array([1.5, -0.5], dtype=np.float32), 256)
         recorder._detect_speech(audio_chunk)
 
-        # Model should be called with float32 tensor
-        mock_model.assert_called()
+        np.testing.assert_allclose(mock_model.call_args[0][0].numpy(), audio_chunk)
+
+    @patch("src.audio_capture.torch.hub.load")
+    def test_accumulates_partial_windows(self, mock_torch_load: MagicMock):
+        """Test sub-window chunks are joined into full windows before VAD."""
+        mock_model = MagicMock()
+        mock_torch_load.return_value = (mock_model, None)
+
+        audio_config = AudioConfig(blocksize=384)
+        vad_config = VADConfig()
+        recorder = AudioRecorder(audio_config, vad_config)
+        recorder._load_vad_model()
+        mock_model.reset_mock()
+
+        # The input tensor is reused, so snapshot what the model sees
+        seen = []
+
+        def score(audio_tensor, sample_rate):
+            seen.append(audio_tensor.numpy().copy())
+            return MagicMock(item=MagicMock(return_value=0.7))
+
+        mock_model.side_effect = score
+
+        first = np.full(384, 0.25, dtype=np.float32)
+        second = np.full(384, 0.5, dtype=np.float32)
+
+        # Not a full window yet: no inference, previous decision is held
+        assert recorder._detect_speech(first) == 0.0
+        mock_model.assert_not_called()
+
+        assert recorder._detect_speech(second) == 0.7
+        assert mock_model.call_count == 1
+        np.testing.assert_allclose(seen[0][:384], 0.25)
+        np.testing.assert_allclose(seen[0][384:], 0.5)
+        assert recorder._vad_fill == 256
+
+    @patch("src.audio_capture.torch.hub.load")
+    def test_scores_multi_window_block_window_by_window(self, mock_torch_load: MagicMock):
+        """Test blocks longer than one VAD window are split and the max is returned."""
+        mock_model = MagicMock()
+        mock_model.return_value.item.side_effect = [0.2, 0.8, 0.4]
+        mock_torch_load.return_value = (mock_model, None)
+
+        audio_config = AudioConfig(blocksize=1536)
+        vad_config = VADConfig()
+        recorder = AudioRecorder(audio_config, vad_config)
+        recorder._load_vad_model()
+        mock_model.reset_mock()
+
+        audio_chunk = np.zeros(1536, dtype=np.float32)
+        prob = recorder._detect_speech(audio_chunk)
+
+        assert prob == 0.8
+        assert mock_model.call_count == 3
+        for call in mock_model.call_args_list:
+            assert call.args[0].shape == (512,)
 
     @patch("src.audio_capture.torch.hub.load")
-    def test_normalizes_audio_if_needed(self, mock_torch_load: MagicMock):
-        """Test audio is normalized if values exceed 1.0."""
+    def test_reuses_vad_input_tensor(self, mock_torch_load: MagicMock):
+        """Test the same preallocated tensor is fed to the model on every call."""
         mock_model = MagicMock()
         mock_model.return_value.item.return_value = 0.5
         mock_torch_load.return_value = (mock_model, None)
@@ -188,27 +366,36 @@ def test_normalizes_audio_if_needed(self, mock_torch_load: MagicMock):
         vad_config = VADConfig()
         recorder = AudioRecorder(audio_config, vad_config)
 
-        # Audio with values > 1.0 (unnormalized int16 range)
-        audio_chunk = np.array([32767, -32768, 16000], dtype=np.float32)
-        recorder._detect_speech(audio_chunk)
+        recorder._detect_speech(np.full(512, 0.25, dtype=np.float32))
+        first_input = mock_model.call_args.args[0]
+        recorder._detect_speech(np.full(512, 0.5, dtype=np.float32))
 
-        mock_model.assert_called()
+        assert mock_model.call_args.args[0] is first_input
+        assert first_input is recorder._vad_input
+        assert float(first_input[0]) == 0.5
 
     @patch("src.audio_capture.torch.hub.load")
-    def test_returns_zero_on_detection_error(self, mock_torch_load: MagicMock):
-        """Test returns 0.0 on detection error."""
+    def test_treats_detection_error_as_silence(self, mock_torch_load: MagicMock):
+        """Test a VAD error propagates from detection and the chunk counts as silence."""
         mock_model = MagicMock()
-        mock_model.side_effect = RuntimeError("Detection failed")
         mock_torch_load.return_value = (mock_model, None)
 
         audio_config = AudioConfig()
         vad_config = VADConfig()
         recorder = AudioRecorder(audio_config, vad_config)
+        recorder._load_vad_model()
+        mock_model.side_effect = RuntimeError("Detection failed")
 
         audio_chunk = np.zeros(512, dtype=np.float32)
-        prob = recorder._detect_speech(audio_chunk)
+        with pytest.raises(RuntimeError, match="Detection failed"):
+            recorder._detect_speech(audio_chunk)
 
-        assert prob == 0.0
+        recorder._process_chunk(audio_chunk)
+        recorder._process_chunk(audio_chunk)
+
+        assert recorder.speech_started is False
+        assert len(recorder.pre_buffer) == 1024
+        assert recorder._vad_failures == 2
 
 
 class TestAudioRecorderAudioCallback:
@@ -228,9 +415,9 @@ def test_handles_speech_start(self, mock_torch_load: MagicMock):
         recorder = AudioRecorder(audio_config, vad_config, on_speech_start=on_speech_start)
         recorder._load_vad_model()
 
-        # Simulate audio callback with speech
+        # Simulate a captured chunk with speech
         indata = np.zeros((512, 1), dtype=np.float32)
-        recorder._audio_callback(indata, 512, None, None)
+        recorder._process_chunk(indata[:, 0])
 
         on_speech_start.assert_called_once()
         assert recorder.speech_started is True
@@ -247,12 +434,35 @@ def test_adds_audio_to_buffer_during_speech(self, mock_torch_load: MagicMock):
         recorder = AudioRecorder(audio_config, vad_config)
         recorder._load_vad_model()
 
-        # Simulate audio callback with speech
+        # Simulate a captured chunk with speech
         indata = np.ones((512, 1), dtype=np.float32) * 0.5
-        recorder._audio_callback(indata, 512, None, None)
+        recorder._process_chunk(indata[:, 0])
 
         assert len(recorder.buffer) == 512
 
+    @patch("src.audio_capture.torch.hub.load")
+    def test_scales_int16_input_to_float32(self, mock_torch_load: MagicMock):
+        """Test int16 callback input is converted to normalized float32."""
+        mock_model = MagicMock()
+        mock_model.return_value.item.return_value = 0.9
+        mock_torch_load.return_value = (mock_model, None)
+
+        audio_config = AudioConfig()
+        vad_config = VADConfig(threshold=0.5)
+        recorder = AudioRecorder(audio_config, vad_config)
+        recorder._load_vad_model()
+        recorder.is_recording = True
+
+        indata = np.full((512, 1), 16384, dtype=np.int16)
+        indata[:2, 0] = [32767, -32768]
+        recorder._audio_callback(indata, 512, None, None)
+        recorder._process_chunk(recorder._audio_queue.get_nowait())
+
+        audio = recorder.buffer.to_array()
+        assert audio.dtype == np.float32
+        np.testing.assert_allclose(audio[:2], [32767 / 32768, -1.0])
+        np.testing.assert_allclose(audio[2:], 0.5)
+
     @patch("src.audio_capture.torch.hub.load")
     def test_adds_audio_to_pre_buffer_without_speech(self, mock_torch_load: MagicMock):
         """Test audio is added to pre-buffer when no speech."""
@@ -265,15 +475,15 @@ def test_adds_audio_to_pre_buffer_without_speech(self, mock_torch_load: MagicMoc
         recorder = AudioRecorder(audio_config, vad_config)
         recorder._load_vad_model()
 
-        # Simulate audio callback without speech
+        # Simulate a captured chunk without speech
         indata = np.zeros((512, 1), dtype=np.float32)
-        recorder._audio_callback(indata, 512, None, None)
+        recorder._process_chunk(indata[:, 0])
 
         assert len(recorder.pre_buffer) == 512
         assert len(recorder.buffer) == 0
 
     @patch("src.audio_capture.torch.hub.load")
-    @patch("src.audio_capture.time.time")
+    @patch("src.audio_capture.time.monotonic_ns")
     def test_stops_recording_on_silence(self, mock_time: MagicMock, mock_torch_load: MagicMock):
         """Test recording stops after silence duration."""
         mock_model = MagicMock()
@@ -288,18 +498,101 @@ def test_stops_recording_on_silence(self, mock_time: MagicMock, mock_torch_load:
 
         # First call: speech detected
         mock_model.return_value.item.return_value = 0.9
-        mock_time.return_value = 0.0
-        recorder.last_speech_time = 0.0
+        mock_time.return_value = 0
+        recorder.last_speech_time = 0
 
         indata = np.zeros((512, 1), dtype=np.float32)
-        recorder._audio_callback(indata, 512, None, None)
+        recorder._process_chunk(indata[:, 0])
 
         # Second call: silence after 1.5s
         mock_model.return_value.item.return_value = 0.1  # No speech
-        mock_time.return_value = 1.5  # 1.5s later
-        recorder._audio_callback(indata, 512, None, None)
+        mock_time.return_value = 1_500_000_000  # 1.5s later
+        recorder._process_chunk(indata[:, 0])
 
         assert recorder.is_recording is False
+        assert recorder._stop_recording.is_set()
+
+    def test_energy_gate_skips_vad_below_noise_floor(self):
+        """Test chunks at the background level do not reach the VAD."""
+        audio_config = AudioConfig()
+        vad_config = VADConfig(threshold=0.5)
+        recorder = AudioRecorder(audio_config, vad_config)
+        recorder._detect_speech = MagicMock(return_value=0.1)
+
+        # Warm-up: the VAD scores these and they measure the noise floor
+        noise = np.full(512, 0.01, dtype=np.float32)
+        for _ in range(_ENERGY_GATE_WARMUP_CHUNKS):
+            recorder._process_chunk(noise)
+        recorder._process_chunk(noise)
+
+        assert recorder._detect_speech.call_count == _ENERGY_GATE_WARMUP_CHUNKS
+        assert recorder._noise_floor == pytest.approx(0.01)
+        assert len(recorder.pre_buffer) == 512 * (_ENERGY_GATE_WARMUP_CHUNKS + 1)
+
+        # A louder chunk goes through the VAD again
+        recorder._detect_speech.return_value = 0.9
+        recorder._process_chunk(np.full(512, 0.2, dtype=np.float32))
+
+        assert recorder._detect_speech.call_count == _ENERGY_GATE_WARMUP_CHUNKS + 1
+        assert recorder.speech_started is True
+
+    def test_energy_gate_detects_speech_in_first_chunk(self):
+        """Test speech scored low by the cold VAD does not gate the speech after it."""
+        audio_config = AudioConfig()
+        vad_config = VADConfig(threshold=0.5)
+        recorder = AudioRecorder(audio_config, vad_config)
+        recorder._detect_speech = MagicMock(side_effect=[0.3, 0.9])
+
+        speech = np.full(512, 0.2, dtype=np.float32)
+        recorder._process_chunk(speech)
+        recorder._process_chunk(speech)
+
+        assert recorder._detect_speech.call_count == 2
+        assert recorder.speech_started is True
+
+    def test_noise_floor_seeded_from_quietest_chunk(self):
+        """Test a loud chunk scored as non-speech does not raise the seeded floor."""
+        audio_config = AudioConfig()
+        vad_config = VADConfig(threshold=0.5)
+        recorder = AudioRecorder(audio_config, vad_config)
+        recorder._detect_speech = MagicMock(return_value=0.1)
+
+        recorder._process_chunk(np.full(512, 0.2, dtype=np.float32))
+        for _ in range(_ENERGY_GATE_WARMUP_CHUNKS - 1):
+            recorder._process_chunk(np.full(512, 0.01, dtype=np.float32))
+
+        assert recorder._noise_floor == pytest.approx(0.01)
+
+    def test_noise_floor_ignores_unscored_chunks(self):
+        """Test gated chunks and chunks without a full VAD window leave the floor alone."""
+        audio_config = AudioConfig(blocksize=256)
+        vad_config = VADConfig(threshold=0.5)
+        recorder = AudioRecorder(audio_config, vad_config)
+        recorder._detect_speech = MagicMock(return_value=0.0)
+
+        # Half a window: the VAD returns its held decision without inference
+        recorder._process_chunk(np.full(256, 0.2, dtype=np.float32))
+        assert recorder._noise_chunks == 0
+
+        recorder._noise_floor = 0.1
+        recorder._noise_chunks = _ENERGY_GATE_WARMUP_CHUNKS
+        recorder._process_chunk(np.full(512, 0.01, dtype=np.float32))  # Gated
+
+        assert recorder._noise_floor == 0.1
+        assert recorder._detect_speech.call_count == 1
+
+    def test_energy_gate_disabled_during_speech(self):
+        """Test the VAD keeps running on quiet chunks once speech has started."""
+        audio_config = AudioConfig()
+        vad_config = VADConfig(threshold=0.5)
+        recorder = AudioRecorder(audio_config, vad_config)
+        recorder._detect_speech = MagicMock(return_value=0.1)
+        recorder._noise_floor = 0.5
+        recorder.speech_started = True
+
+        recorder._process_chunk(np.zeros(512, dtype=np.float32))
+
+        recorder._detect_speech.assert_called_once()
 
     def test_handles_stream_status_warning(self):
         """Test stream status warnings are logged."""
@@ -315,20 +608,65 @@ def test_handles_stream_status_warning(self):
         status = "Input overflow"
 
         # Should not raise, just log
+        recorder.is_recording = True
         recorder._audio_callback(indata, 512, None, status)
 
+    def test_callback_only_enqueues_audio(self):
+        """Test the callback hands a copy of the chunk to the VAD worker queue."""
+        audio_config = AudioConfig()
+        vad_config = VADConfig()
+        recorder = AudioRecorder(audio_config, vad_config)
+        recorder._detect_speech = MagicMock(return_value=0.9)
+        recorder.is_recording = True
+
+        indata = np.full((512, 1), 0.25, dtype=np.float32)
+        recorder._audio_callback(indata, 512, None, None)
+        indata[:] = 0.0
+
+        recorder._detect_speech.assert_not_called()
+        chunk = recorder._audio_queue.get_nowait()
+        assert chunk.shape == (512,)
+        np.testing.assert_allclose(chunk, 0.25)
+
+    def test_vad_worker_processes_queued_chunks(self):
+        """Test the VAD worker drains queued chunks before stopping."""
+        audio_config = AudioConfig()
+        vad_config = VADConfig(threshold=0.5)
+        recorder = AudioRecorder(audio_config, vad_config)
+        recorder._detect_speech = MagicMock(return_value=0.9)
+        recorder.is_recording = True
+
+        recorder._start_vad_worker()
+        indata = np.zeros((512, 1), dtype=np.float32)
+        recorder._audio_callback(indata, 512, None, None)
+        recorder._audio_callback(indata, 512, None, None)
+        recorder._stop_vad_worker()
+
+        assert recorder._vad_thread is None
+        assert recorder._detect_speech.call_count == 2
+        assert len(recorder.buffer) == 1024
+
+    def test_callback_ignores_audio_when_not_recording(self):
+        """Test the running stream feeds nothing to the worker between recordings."""
+        audio_config = AudioConfig()
+        vad_config = VADConfig()
+        recorder = AudioRecorder(audio_config, vad_config)
+
+        indata = np.zeros((512, 1), dtype=np.float32)
+        recorder._audio_callback(indata, 512, None, None)
+
+        assert recorder._audio_queue.empty()
+
 
 class TestAudioRecorderRecordUntilSilence:
     """Tests for record_until_silence method."""
 
     @patch("src.audio_capture.sd.InputStream")
     @patch("src.audio_capture.torch.hub.load")
-    @patch("src.audio_capture.time.sleep")
-    @patch("src.audio_capture.time.time")
+    @patch("src.audio_capture.time.monotonic_ns")
     def test_returns_audio_on_successful_recording(
         self,
         mock_time: MagicMock,
-        mock_sleep: MagicMock,
         mock_torch_load: MagicMock,
         mock_stream: MagicMock,
     ):
@@ -340,26 +678,20 @@ def test_returns_audio_on_successful_recording(
         vad_config = VADConfig()
         recorder = AudioRecorder(audio_config, vad_config)
 
-        # Mock context manager
-        mock_context = MagicMock()
-        mock_stream.return_value.__enter__ = MagicMock(return_value=mock_context)
-        mock_stream.return_value.__exit__ = MagicMock(return_value=False)
-
         # Time progression to simulate recording
-        time_calls = [0.0, 0.0, 0.1, 0.2]
+        time_calls = [0, 100_000_000, 200_000_000]
         mock_time.side_effect = time_calls
 
-        # Populate buffer and stop recording on first sleep
+        # Populate buffer and stop recording on first wait
         min_samples = int(0.1 * 16000)  # 1600 samples
 
         def stop_recording(_):
             # Add samples to buffer AFTER record_until_silence clears it
             recorder.buffer.extend(np.zeros(min_samples + 100, dtype=np.float32))
-            recorder.is_recording = False
-
-        mock_sleep.side_effect = stop_recording
+            recorder._stop_recording.set()
 
-        result = recorder.record_until_silence()
+        with patch.object(recorder._stop_recording, "wait", side_effect=stop_recording):
+            result = recorder.record_until_silence()
 
         assert result is not None
         assert isinstance(result, np.ndarray)
@@ -381,15 +713,108 @@ def test_returns_none_on_stream_error(self, mock_torch_load: MagicMock, mock_str
         result = recorder.record_until_silence()
 
         assert result is None
+        # Each recording starts from a fresh VAD state (after the warm-up reset)
+        assert mock_model.reset_states.call_count == 2
+        assert recorder._stream is None
+        assert recorder.is_recording is False
+
+    @patch("src.audio_capture.atexit")
+    @patch("src.audio_capture.sd.InputStream")
+    @patch("src.audio_capture.torch.hub.load")
+    def test_reuses_stream_across_recordings(
+        self, mock_torch_load: MagicMock, mock_stream: MagicMock, mock_atexit: MagicMock
+    ):
+        """Test the input stream is opened once and stays open between recordings."""
+        mock_torch_load.return_value = (MagicMock(), None)
+
+        audio_config = AudioConfig(sample_rate=16000, min_speech_duration=0.1)
+        vad_config = VADConfig()
+        recorder = AudioRecorder(audio_config, vad_config)
+
+        def stop_recording(_):
+            recorder.buffer.extend(np.zeros(2000, dtype=np.float32))
+            recorder._stop_recording.set()
+
+        with patch.object(recorder._stop_recording, "wait", side_effect=stop_recording):
+            assert recorder.record_until_silence() is not None
+            assert recorder.record_until_silence() is not None
+
+        mock_stream.assert_called_once()
+        mock_stream.return_value.start.assert_called_once()
+        mock_stream.return_value.close.assert_not_called()
+        mock_atexit.register.assert_called_once_with(recorder.close)
+        assert recorder.is_recording is False
+
+        recorder.close()
+
+        mock_stream.return_value.close.assert_called_once()
+        mock_atexit.unregister.assert_called_once_with(recorder.close)
+        assert recorder._stream is None
+
+    @patch("src.audio_capture.atexit")
+    @patch("src.audio_capture.sd.InputStream")
+    @patch("src.audio_capture.torch.hub.load")
+    def test_reopens_stream_stopped_by_portaudio(
+        self, mock_torch_load: MagicMock, mock_stream: MagicMock, mock_atexit: MagicMock
+    ):
+        """Test a stream that stopped on its own is replaced by the next recording."""
+        mock_torch_load.return_value = (MagicMock(), None)
+        stale_stream, fresh_stream = MagicMock(), MagicMock()
+        mock_stream.side_effect = [stale_stream, fresh_stream]
+
+        audio_config = AudioConfig(sample_rate=16000, min_speech_duration=0.1)
+        vad_config = VADConfig()
+        recorder = AudioRecorder(audio_config, vad_config)
+
+        def stop_recording(_):
+            recorder.buffer.extend(np.zeros(2000, dtype=np.float32))
+            recorder._stop_recording.set()
+
+        with patch.object(recorder._stop_recording, "wait", side_effect=stop_recording):
+            assert recorder.record_until_silence() is not None
+            stale_stream.active = False  # e.g. the device was unplugged
+            assert recorder.record_until_silence() is not None
+
+        assert mock_stream.call_count == 2
+        stale_stream.close.assert_called_once()
+        fresh_stream.start.assert_called_once()
+        assert recorder._stream is fresh_stream
 
     @patch("src.audio_capture.sd.InputStream")
     @patch("src.audio_capture.torch.hub.load")
-    @patch("src.audio_capture.time.sleep")
-    @patch("src.audio_capture.time.time")
+    def test_accepts_audio_only_once_worker_queue_is_ready(
+        self, mock_torch_load: MagicMock, mock_stream: MagicMock
+    ):
+        """Test recording is flagged only after the VAD worker's new queue exists."""
+        mock_torch_load.return_value = (MagicMock(), None)
+
+        audio_config = AudioConfig(sample_rate=16000, min_speech_duration=0.1)
+        vad_config = VADConfig()
+        recorder = AudioRecorder(audio_config, vad_config)
+        start_worker = recorder._start_vad_worker
+        recording_at_start = []
+
+        def record_state_and_start():
+            recording_at_start.append(recorder.is_recording)
+            start_worker()
+
+        def stop_recording(_):
+            recorder._stop_recording.set()
+
+        with (
+            patch.object(recorder, "_start_vad_worker", side_effect=record_state_and_start),
+            patch.object(recorder._stop_recording, "wait", side_effect=stop_recording),
+        ):
+            recorder.record_until_silence()
+
+        assert recording_at_start == [False]
+
+    @patch("src.audio_capture.sd.InputStream")
+    @patch("src.audio_capture.torch.hub.load")
+    @patch("src.audio_capture.time.monotonic_ns")
     def test_returns_none_if_recording_too_short(
         self,
         mock_time: MagicMock,
-        mock_sleep: MagicMock,
         mock_torch_load: MagicMock,
         mock_stream: MagicMock,
     ):
@@ -402,32 +827,25 @@ def test_returns_none_if_recording_too_short(
         recorder = AudioRecorder(audio_config, vad_config)
 
         # Buffer with insufficient samples
-        recorder.buffer = collections.deque(np.zeros(100, dtype=np.float32), maxlen=16000 * 30)
-
-        mock_context = MagicMock()
-        mock_stream.return_value.__enter__ = MagicMock(return_value=mock_context)
-        mock_stream.return_value.__exit__ = MagicMock(return_value=False)
+        recorder.buffer.extend(np.zeros(100, dtype=np.float32))
 
-        time_calls = [0.0, 0.0, 0.1]
+        time_calls = [0, 100_000_000]
         mock_time.side_effect = time_calls
 
         def stop_recording(_):
-            recorder.is_recording = False
+            recorder._stop_recording.set()
 
-        mock_sleep.side_effect = stop_recording
-
-        result = recorder.record_until_silence()
+        with patch.object(recorder._stop_recording, "wait", side_effect=stop_recording):
+            result = recorder.record_until_silence()
 
         assert result is None
 
     @patch("src.audio_capture.sd.InputStream")
     @patch("src.audio_capture.torch.hub.load")
-    @patch("src.audio_capture.time.sleep")
-    @patch("src.audio_capture.time.time")
+    @patch("src.audio_capture.time.monotonic_ns")
     def test_respects_max_recording_duration(
         self,
         mock_time: MagicMock,
-        mock_sleep: MagicMock,
         mock_torch_load: MagicMock,
         mock_stream: MagicMock,
     ):
@@ -441,30 +859,28 @@ def test_respects_max_recording_duration(
         vad_config = VADConfig()
         recorder = AudioRecorder(audio_config, vad_config)
 
-        mock_context = MagicMock()
-        mock_stream.return_value.__enter__ = MagicMock(return_value=mock_context)
-        mock_stream.return_value.__exit__ = MagicMock(return_value=False)
-
         # Simulate time progressing past max duration
         call_count = [0]
 
         def time_effect():
             call_count[0] += 1
             if call_count[0] <= 2:
-                return 0.0
-            return 6.0  # Past max duration
+                return 0
+            return 6_000_000_000  # Past max duration
 
         mock_time.side_effect = time_effect
 
-        def sleep_effect(_):
+        def wait_effect(timeout):
             # Add samples to buffer to simulate recording
             recorder.buffer.extend(np.zeros(3200, dtype=np.float32))
+            return False
 
-        mock_sleep.side_effect = sleep_effect
-
-        result = recorder.record_until_silence()
+        with patch.object(recorder._stop_recording, "wait", side_effect=wait_effect) as mock_wait:
+            result = recorder.record_until_silence()
 
         assert result is not None  # Should have returned audio
+        # Waits for the 5s no-speech deadline, not a fixed poll interval
+        mock_wait.assert_called_once_with(5.0)
 
 
 class TestAudioRecorderDevices:
@@ -489,6 +905,20 @@ def test_get_available_devices(self, mock_query: MagicMock):
         assert devices[0]["name"] == "Microphone"
         assert devices[1]["name"] == "Webcam Mic"
 
+    @patch("src.audio_capture.sd.query_devices")
+    def test_queries_devices_once(self, mock_query: MagicMock):
+        """Test the PortAudio device list is queried once and reused."""
+        mock_query.return_value = [{"name": "Microphone", "max_input_channels": 2}]
+
+        audio_config = AudioConfig()
+        vad_config = VADConfig()
+        recorder = AudioRecorder(audio_config, vad_config)
+
+        recorder.get_available_devices()
+        recorder.get_available_devices()
+
+        mock_query.assert_called_once()
+
     @patch("src.audio_capture.sd.default")
     def test_set_default_device(self, mock_default: MagicMock):
         """Test setting default audio device."""
@@ -497,10 +927,15 @@ def test_set_default_device(self, mock_default: MagicMock):
         audio_config = AudioConfig()
         vad_config = VADConfig()
         recorder = AudioRecorder(audio_config, vad_config)
+        stream = MagicMock()
+        recorder._stream = stream
 
         recorder.set_default_device(2)
 
         assert mock_default.device == (2, 0)
+        # The next recording opens a stream on the new device
+        stream.close.assert_called_once()
+        assert recorder._stream is None
 
     @patch("src.audio_capture.sd.default")
     def test_reset_default_device(self, mock_default: MagicMock):
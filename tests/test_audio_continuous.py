@@ -90,17 +90,18 @@ def test_callback_creates_segment_on_silence(self, audio_config, vad_config):
         recorder.buffer.extend(test_audio)
 
         # Simulate silence detected (past silence threshold)
-        recorder.last_speech_time = time.time() - audio_config.silence_duration - 0.1
+        recorder.last_speech_time = time.monotonic_ns() - int(
+            (audio_config.silence_duration + 0.1) * 1e9
+        )
 
         # Mock VAD to return no speech
         with patch.object(recorder, "_detect_speech", return_value=0.1):
             indata = np.zeros((audio_config.blocksize, 1), dtype=np.float32)
-            recorder._audio_callback(indata, audio_config.blocksize, None, None)
+            recorder._process_chunk(indata[:, 0])
 
         # Should have created a segment and signaled ready
-        assert recorder._segment_ready.is_set()
-        assert recorder._current_segment is not None
-        assert len(recorder._current_segment) > 0
+        segment = recorder._segment_queue.get_nowait()
+        assert len(segment) > 0
 
     def test_callback_resets_after_segment(self, audio_config, vad_config):
         """Test that callback resets state after segment in continuous mode."""
@@ -115,11 +116,13 @@ def test_callback_resets_after_segment(self, audio_config, vad_config):
         recorder.buffer.extend(test_audio)
 
         # Simulate silence
-        recorder.last_speech_time = time.time() - audio_config.silence_duration - 0.1
+        recorder.last_speech_time = time.monotonic_ns() - int(
+            (audio_config.silence_duration + 0.1) * 1e9
+        )
 
         with patch.object(recorder, "_detect_speech", return_value=0.1):
             indata = np.zeros((audio_config.blocksize, 1), dtype=np.float32)
-            recorder._audio_callback(indata, audio_config.blocksize, None, None)
+            recorder._process_chunk(indata[:, 0])
 
         # Buffer should be cleared and speech_started reset
         assert len(recorder.buffer) == 0
@@ -138,11 +141,13 @@ def test_callback_continues_recording_in_continuous_mode(self, audio_config, vad
         recorder.buffer.extend(test_audio)
 
         # Simulate silence
-        recorder.last_speech_time = time.time() - audio_config.silence_duration - 0.1
+        recorder.last_speech_time = time.monotonic_ns() - int(
+            (audio_config.silence_duration + 0.1) * 1e9
+        )
 
         with patch.object(recorder, "_detect_speech", return_value=0.1):
             indata = np.zeros((audio_config.blocksize, 1), dtype=np.float32)
-            recorder._audio_callback(indata, audio_config.blocksize, None, None)
+            recorder._process_chunk(indata[:, 0])
 
         # Should still be recording
         assert recorder.is_recording
@@ -160,15 +165,16 @@ def test_callback_ignores_short_segments(self, audio_config, vad_config):
         recorder.buffer.extend(short_audio)
 
         # Simulate silence
-        recorder.last_speech_time = time.time() - audio_config.silence_duration - 0.1
+        recorder.last_speech_time = time.monotonic_ns() - int(
+            (audio_config.silence_duration + 0.1) * 1e9
+        )
 
         with patch.object(recorder, "_detect_speech", return_value=0.1):
             indata = np.zeros((audio_config.blocksize, 1), dtype=np.float32)
-            recorder._audio_callback(indata, audio_config.blocksize, None, None)
+            recorder._process_chunk(indata[:, 0])
 
         # Should not have created a segment
-        assert not recorder._segment_ready.is_set()
-        assert recorder._current_segment is None
+        assert recorder._segment_queue.empty()
 
 
 class TestContinuousRecordingIntegration:
@@ -187,11 +193,9 @@ def test_record_continuous_yields_segments(self, mock_stream, audio_config, vad_
         def simulate_segments():
             """Simulate segment production in a separate thread."""
             time.sleep(0.1)
-            recorder._current_segment = segment1
-            recorder._segment_ready.set()
+            recorder._segment_queue.put(segment1)
             time.sleep(0.1)
-            recorder._current_segment = segment2
-            recorder._segment_ready.set()
+            recorder._segment_queue.put(segment2)
             time.sleep(0.1)
             recorder.stop_continuous()
 
@@ -206,6 +210,55 @@ def simulate_segments():
 
         assert len(segments) >= 2
 
+    @patch("src.audio_capture.sd.InputStream")
+    def test_record_continuous_keeps_back_to_back_segments(
+        self, mock_stream, audio_config, vad_config
+    ):
+        """Test segments finished before they are consumed are all yielded, in order."""
+        recorder = AudioRecorder(audio_config, vad_config)
+        recorder._load_vad_model = MagicMock()
+
+        segment1 = np.full(audio_config.sample_rate, 0.1, dtype=np.float32)
+        segment2 = np.full(audio_config.sample_rate, 0.2, dtype=np.float32)
+
+        def finish_segments_and_stop():
+            time.sleep(0.1)
+            recorder._segment_queue.put(segment1)
+            recorder._segment_queue.put(segment2)
+            recorder.stop_continuous()
+
+        sim_thread = threading.Thread(target=finish_segments_and_stop)
+        sim_thread.start()
+
+        segments = list(recorder.record_continuous())
+        sim_thread.join()
+
+        assert len(segments) == 2
+        assert segments[0] is segment1
+        assert segments[1] is segment2
+
+    def test_record_continuous_keeps_segment_finished_while_stopping(
+        self, audio_config, vad_config
+    ):
+        """Test chunks still queued for the VAD worker at stop end up in a segment."""
+        recorder = AudioRecorder(audio_config, vad_config)
+        recorder._load_vad_model = MagicMock()
+        recorder._silence_duration_ns = 0
+        recorder._detect_speech = MagicMock(side_effect=[0.9, 0.9, 0.9, 0.9, 0.1])
+
+        def queue_chunks_and_stop():
+            # Four speech chunks then one silent chunk, which ends the segment
+            for _ in range(5):
+                recorder._audio_queue.put(np.full(512, 0.2, dtype=np.float32))
+            recorder.stop_continuous()
+
+        with patch.object(recorder, "_ensure_stream", side_effect=queue_chunks_and_stop):
+            segments = list(recorder.record_continuous())
+
+        assert recorder._detect_speech.call_count == 5
+        assert [len(segment) for segment in segments] == [5 * 512]
+        assert recorder._vad_thread is None
+
     @patch("src.audio_capture.sd.InputStream")
     def test_record_continuous_stops_on_stop_call(self, mock_stream, audio_config, vad_config):
         """Test that record_continuous stops when stop_continuous is called."""
@@ -158,43 +158,35 @@ class TestXdotoolPasterMocked:
     """Tests for XdotoolPaster with mocking."""
 
     @patch("src.autopaste.subprocess.run")
+    @patch("src.autopaste.shutil.which")
     @patch.dict("os.environ", {"DISPLAY": ":0"})
-    def test_is_available_when_xdotool_installed(self, mock_run: MagicMock):
+    def test_is_available_when_xdotool_installed(self, mock_which: MagicMock, mock_run: MagicMock):
         """Test is_available returns True when xdotool is installed and DISPLAY set."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_which.return_value = "/usr/bin/xdotool"
         paster = XdotoolPaster(timeout=2.0)
 
         result = paster.is_available()
 
         assert result is True
+        mock_which.assert_called_once_with("xdotool")
+        mock_run.assert_not_called()
 
-    @patch("src.autopaste.subprocess.run")
+    @patch("src.autopaste.shutil.which")
     @patch.dict("os.environ", {"DISPLAY": ""}, clear=True)
-    def test_is_available_when_no_display(self, mock_run: MagicMock):
+    def test_is_available_when_no_display(self, mock_which: MagicMock):
         """Test is_available returns False when DISPLAY not set."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_which.return_value = "/usr/bin/xdotool"
         paster = XdotoolPaster(timeout=2.0)
 
         result = paster.is_available()
 
         assert result is False
 
-    @patch("src.autopaste.subprocess.run")
-    def test_is_available_when_xdotool_not_installed(self, mock_run: MagicMock):
+    @patch("src.autopaste.shutil.which")
+    @patch.dict("os.environ", {"DISPLAY": ":0"})
+    def test_is_available_when_xdotool_not_installed(self, mock_which: MagicMock):
         """Test is_available returns False when xdotool not installed."""
-        mock_run.return_value = MagicMock(returncode=1)
-        paster = XdotoolPaster(timeout=2.0)
-
-        result = paster.is_available()
-
-        assert result is False
-
-    @patch("src.autopaste.subprocess.run")
-    def test_is_available_on_timeout(self, mock_run: MagicMock):
-        """Test is_available returns False on timeout."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.TimeoutExpired("which", 1)
+        mock_which.return_value = None
         paster = XdotoolPaster(timeout=2.0)
 
         result = paster.is_available()
@@ -254,31 +246,48 @@ class TestYdotoolPasterMocked:
     """Tests for YdotoolPaster with mocking."""
 
     @patch("src.autopaste.subprocess.run")
-    def test_is_available_when_ydotool_and_daemon_running(self, mock_run: MagicMock):
+    @patch("src.autopaste.shutil.which")
+    def test_is_available_when_ydotool_and_daemon_running(
+        self, mock_which: MagicMock, mock_run: MagicMock
+    ):
         """Test is_available returns True when ydotool and daemon are available."""
+        mock_which.return_value = "/usr/bin/ydotool"
         mock_run.return_value = MagicMock(returncode=0)
         paster = YdotoolPaster(timeout=2.0)
 
         result = paster.is_available()
 
         assert result is True
-        # Should check both 'which ydotool' and 'pgrep ydotoold'
-        assert mock_run.call_count == 2
+        # Only the daemon check ('pgrep ydotoold') needs a subprocess
+        mock_which.assert_called_once_with("ydotool")
+        assert mock_run.call_count == 1
 
     @patch("src.autopaste.subprocess.run")
-    def test_is_available_when_daemon_not_running(self, mock_run: MagicMock):
+    @patch("src.autopaste.shutil.which")
+    def test_is_available_when_daemon_not_running(self, mock_which: MagicMock, mock_run: MagicMock):
         """Test is_available returns False when daemon not running."""
-        # First call (which ydotool) succeeds, second call (pgrep) fails
-        mock_run.side_effect = [
-            MagicMock(returncode=0),  # which ydotool
-            MagicMock(returncode=1),  # pgrep ydotoold
-        ]
+        mock_which.return_value = "/usr/bin/ydotool"
+        mock_run.return_value = MagicMock(returncode=1)  # pgrep ydotoold
         paster = YdotoolPaster(timeout=2.0)
 
         result = paster.is_available()
 
         assert result is False
 
+    @patch("src.autopaste.subprocess.run")
+    @patch("src.autopaste.shutil.which")
+    def test_is_available_when_ydotool_not_installed(
+        self, mock_which: MagicMock, mock_run: MagicMock
+    ):
+        """Test is_available returns False without probing the daemon."""
+        mock_which.return_value = None
+        paster = YdotoolPaster(timeout=2.0)
+
+        result = paster.is_available()
+
+        assert result is False
+        mock_run.assert_not_called()
+
     @patch("src.autopaste.subprocess.run")
     def test_paste_ctrl_v(self, mock_run: MagicMock):
         """Test paste with Ctrl+V (use_shift=False)."""
@@ -327,22 +336,23 @@ def test_paste_failure(self, mock_run: MagicMock):
 class TestWtypePasterMocked:
     """Tests for WtypePaster with mocking."""
 
-    @patch("src.autopaste.subprocess.run")
+    @patch("src.autopaste.shutil.which")
     @patch.dict("os.environ", {"WAYLAND_DISPLAY": "wayland-0"})
-    def test_is_available_when_wtype_installed_and_wayland(self, mock_run: MagicMock):
+    def test_is_available_when_wtype_installed_and_wayland(self, mock_which: MagicMock):
         """Test is_available returns True when wtype installed and Wayland session."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_which.return_value = "/usr/bin/wtype"
         paster = WtypePaster(timeout=2.0)
 
         result = paster.is_available()
 
         assert result is True
+        mock_which.assert_called_once_with("wtype")
 
-    @patch("src.autopaste.subprocess.run")
+    @patch("src.autopaste.shutil.which")
     @patch.dict("os.environ", {"WAYLAND_DISPLAY": ""}, clear=True)
-    def test_is_available_when_no_wayland_display(self, mock_run: MagicMock):
+    def test_is_available_when_no_wayland_display(self, mock_which: MagicMock):
         """Test is_available returns False when WAYLAND_DISPLAY not set."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_which.return_value = "/usr/bin/wtype"
         paster = WtypePaster(timeout=2.0)
 
         result = paster.is_available()
@@ -557,6 +567,7 @@ def test_returns_empty_when_no_tools_available(
 
         assert result == []
 
+    @patch("src.autopaste.platform.system", return_value="Darwin")
     @patch("src.autopaste.WtypePaster")
     @patch("src.autopaste.YdotoolPaster")
     @patch("src.autopaste.XdotoolPaster")
@@ -567,8 +578,9 @@ def test_mac_paster_first_on_macos(
         mock_xdotool: MagicMock,
         mock_ydotool: MagicMock,
         mock_wtype: MagicMock,
+        mock_system: MagicMock,
     ):
-        """Test that MacPaster is first in the list when available."""
+        """Test that only MacPaster is probed on macOS."""
         mock_mac_instance = MagicMock()
         mock_mac_instance.is_available.return_value = True
         mock_mac.return_value = mock_mac_instance
@@ -589,62 +601,91 @@ def test_mac_paster_first_on_macos(
 
         assert len(result) == 1
         assert result[0] == mock_mac_instance
+        mock_xdotool_instance.is_available.assert_not_called()
+        mock_ydotool_instance.is_available.assert_not_called()
+        mock_wtype_instance.is_available.assert_not_called()
+
+    @patch("src.autopaste.platform.system", return_value="Linux")
+    @patch("src.autopaste.MacPaster")
+    def test_skips_mac_paster_on_linux(self, mock_mac: MagicMock, mock_system: MagicMock):
+        """Test that osascript is not probed outside macOS."""
+        with (
+            patch("src.autopaste.XdotoolPaster.is_available", return_value=False),
+            patch("src.autopaste.YdotoolPaster.is_available", return_value=False),
+            patch("src.autopaste.WtypePaster.is_available", return_value=False),
+        ):
+            result = _detect_available_tools(timeout=2.0)
+
+        assert result == []
+        mock_mac.assert_not_called()
 
 
 class TestCreateAutopasterMocked:
     """Tests for create_autopaster function with mocking."""
 
-    @patch("src.autopaste._detect_available_tools")
-    def test_raises_when_no_tools_available(self, mock_detect: MagicMock):
+    @staticmethod
+    def _tool(spec: type, available: bool) -> MagicMock:
+        tool = MagicMock(spec=spec)
+        tool.is_available.return_value = available
+        return tool
+
+    @patch("src.autopaste._iter_candidate_tools")
+    def test_raises_when_no_tools_available(self, mock_iter: MagicMock):
         """Test RuntimeError raised when no tools available."""
-        mock_detect.return_value = []
+        mock_iter.return_value = iter([self._tool(XdotoolPaster, False)])
 
         with pytest.raises(RuntimeError, match="No auto-paste tool available"):
             create_autopaster()
 
-    @patch("src.autopaste._detect_available_tools")
-    def test_returns_first_available_tool_on_auto(self, mock_detect: MagicMock):
+    @patch("src.autopaste._iter_candidate_tools")
+    def test_returns_first_available_tool_on_auto(self, mock_iter: MagicMock):
         """Test returns first available tool when preferred_tool is auto."""
-        mock_tool1 = MagicMock(spec=XdotoolPaster)
-        mock_tool2 = MagicMock(spec=YdotoolPaster)
-        mock_detect.return_value = [mock_tool1, mock_tool2]
+        mock_tool1 = self._tool(XdotoolPaster, True)
+        mock_tool2 = self._tool(YdotoolPaster, True)
+        mock_iter.return_value = iter([mock_tool1, mock_tool2])
 
         result = create_autopaster(preferred_tool="auto")
 
         assert result == mock_tool1
+        # Detection stops at the first available tool
+        mock_tool2.is_available.assert_not_called()
 
-    @patch("src.autopaste._detect_available_tools")
-    def test_returns_preferred_tool_if_available(self, mock_detect: MagicMock):
+    @patch("src.autopaste._iter_candidate_tools")
+    @patch("src.autopaste.YdotoolPaster")
+    def test_returns_preferred_tool_if_available(
+        self, mock_ydotool: MagicMock, mock_iter: MagicMock
+    ):
         """Test returns preferred tool if available."""
-        mock_xdotool = MagicMock(spec=XdotoolPaster)
-        mock_ydotool = MagicMock(spec=YdotoolPaster)
-        mock_detect.return_value = [mock_xdotool, mock_ydotool]
+        mock_ydotool.return_value = self._tool(YdotoolPaster, True)
 
         result = create_autopaster(preferred_tool="ydotool")
 
-        assert result == mock_ydotool
+        assert result == mock_ydotool.return_value
+        mock_iter.assert_not_called()
 
-    @patch("src.autopaste._detect_available_tools")
-    def test_falls_back_when_preferred_not_available(self, mock_detect: MagicMock):
+    @patch("src.autopaste._iter_candidate_tools")
+    @patch("src.autopaste.YdotoolPaster")
+    def test_falls_back_when_preferred_not_available(
+        self, mock_ydotool: MagicMock, mock_iter: MagicMock
+    ):
         """Test falls back to first available when preferred not found."""
-        mock_xdotool = MagicMock(spec=XdotoolPaster)
-        mock_detect.return_value = [mock_xdotool]
+        mock_ydotool.return_value = self._tool(YdotoolPaster, False)
+        mock_xdotool = self._tool(XdotoolPaster, True)
+        mock_iter.return_value = iter([mock_xdotool])
 
         # Request ydotool but only xdotool is available
         result = create_autopaster(preferred_tool="ydotool")
 
         assert result == mock_xdotool
 
-    @patch("src.autopaste._detect_available_tools")
-    def test_returns_osascript_when_preferred(self, mock_detect: MagicMock):
+    @patch("src.autopaste.MacPaster")
+    def test_returns_osascript_when_preferred(self, mock_mac: MagicMock):
         """Test returns MacPaster when osascript is preferred."""
-        mock_mac = MagicMock(spec=MacPaster)
-        mock_xdotool = MagicMock(spec=XdotoolPaster)
-        mock_detect.return_value = [mock_mac, mock_xdotool]
+        mock_mac.return_value = self._tool(MacPaster, True)
 
         result = create_autopaster(preferred_tool="osascript")
 
-        assert result == mock_mac
+        assert result == mock_mac.return_value
 
 
 class TestAutoPasteFunction:
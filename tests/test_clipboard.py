@@ -122,6 +122,16 @@ def test_initializes_with_default_timeout(self, mock_which: MagicMock):
 
         assert manager.timeout == 2.0
 
+    @patch("shutil.which")
+    def test_looks_up_wl_copy_once(self, mock_which: MagicMock):
+        """Test PATH is searched only once across manager instances."""
+        mock_which.return_value = "/usr/bin/wl-copy"
+
+        WaylandClipboardManager()
+        WaylandClipboardManager()
+
+        mock_which.assert_called_once_with("wl-copy")
+
     @patch("shutil.which")
     def test_initializes_with_custom_timeout(self, mock_which: MagicMock):
         """Test initialization with custom timeout."""
@@ -139,7 +149,7 @@ def test_copy_returns_true_on_success(self, mock_popen: MagicMock, mock_which: M
         mock_process = MagicMock()
         mock_process.stdin = MagicMock()
         mock_process.stderr = MagicMock()
-        mock_process.poll.return_value = None
+        mock_process.wait.return_value = 0
         mock_popen.return_value = mock_process
 
         manager = WaylandClipboardManager()
@@ -148,6 +158,24 @@ def test_copy_returns_true_on_success(self, mock_popen: MagicMock, mock_which: M
         assert result is True
         mock_process.stdin.write.assert_called_once()
         mock_process.stdin.close.assert_called_once()
+        # Waits for wl-copy to fork instead of sleeping a fixed delay
+        mock_process.wait.assert_called_once_with(timeout=2.0)
+
+    @patch("shutil.which")
+    @patch("src.clipboard.subprocess.Popen")
+    def test_copy_returns_true_when_wl_copy_stays_in_foreground(
+        self, mock_popen: MagicMock, mock_which: MagicMock
+    ):
+        """Test that copy succeeds when wl-copy is still running after the timeout."""
+        mock_which.return_value = "/usr/bin/wl-copy"
+        mock_process = MagicMock()
+        mock_process.wait.side_effect = subprocess.TimeoutExpired(cmd="wl-copy", timeout=2.0)
+        mock_popen.return_value = mock_process
+
+        manager = WaylandClipboardManager()
+        result = manager.copy("test text")
+
+        assert result is True
 
     @patch("shutil.which")
     def test_copy_returns_false_for_empty_text(self, mock_which: MagicMock):
@@ -170,8 +198,7 @@ def test_copy_returns_false_on_process_error(
         mock_process.stdin = MagicMock()
         mock_process.stderr = MagicMock()
         mock_process.stderr.read.return_value = b"error"
-        mock_process.poll.return_value = 1
-        mock_process.returncode = 1
+        mock_process.wait.return_value = 1
         mock_popen.return_value = mock_process
 
         manager = WaylandClipboardManager()
@@ -184,7 +211,7 @@ def test_copy_returns_false_on_process_error(
     def test_paste_returns_text_on_success(self, mock_run: MagicMock, mock_which: MagicMock):
         """Test that paste returns text on success."""
         mock_which.return_value = "/usr/bin/wl-copy"
-        mock_run.return_value = MagicMock(returncode=0, stdout="pasted text")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"pasted text")
 
         manager = WaylandClipboardManager()
         result = manager.paste()
@@ -196,7 +223,7 @@ def test_paste_returns_text_on_success(self, mock_run: MagicMock, mock_which: Ma
     def test_paste_returns_none_on_error(self, mock_run: MagicMock, mock_which: MagicMock):
         """Test that paste returns None on error."""
         mock_which.return_value = "/usr/bin/wl-copy"
-        mock_run.return_value = MagicMock(returncode=1, stderr="error")
+        mock_run.return_value = MagicMock(returncode=1, stderr=b"error")
 
         manager = WaylandClipboardManager()
         result = manager.paste()
@@ -407,7 +434,7 @@ def test_copy_returns_false_on_exception(self, mock_run: MagicMock, mock_which:
     def test_paste_with_xclip(self, mock_run: MagicMock, mock_which: MagicMock):
         """Test paste using xclip."""
         mock_which.return_value = "/usr/bin/xclip"
-        mock_run.return_value = MagicMock(returncode=0, stdout="pasted text")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"pasted text")
 
         manager = X11ClipboardManager()
         result = manager.paste()
@@ -428,7 +455,7 @@ def which_side_effect(cmd):
             return None
 
         mock_which.side_effect = which_side_effect
-        mock_run.return_value = MagicMock(returncode=0, stdout="pasted text")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"pasted text")
 
         manager = X11ClipboardManager()
         result = manager.paste()
@@ -600,7 +627,7 @@ def test_copy_returns_false_on_exception(self, mock_run: MagicMock, mock_which:
     def test_paste_returns_text_on_success(self, mock_run: MagicMock, mock_which: MagicMock):
         """Test that paste returns text on success."""
         mock_which.return_value = "/usr/bin/pbcopy"
-        mock_run.return_value = MagicMock(returncode=0, stdout="pasted text")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"pasted text")
 
         manager = MacClipboardManager()
         result = manager.paste()
@@ -2,15 +2,20 @@
 """Tests for configuration module."""
 
 import tempfile
+from dataclasses import fields
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
 
 from src.config import (
+    _SECTION_FIELDS,
+    _YAML_CACHE,
     AudioConfig,
     ClipboardConfig,
     Config,
+    HistoryConfig,
     HotkeyConfig,
     LoggingConfig,
     PasteConfig,
@@ -20,6 +25,14 @@
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_yaml_cache():
+    """Drop parsed config files so each test reads its own file."""
+    _YAML_CACHE.clear()
+    yield
+    _YAML_CACHE.clear()
+
+
 class TestAudioConfig:
     """Tests for AudioConfig dataclass."""
 
@@ -34,6 +47,13 @@ def test_default_values(self):
         assert config.max_recording_duration == 30
         assert config.blocksize == 512
 
+    def test_rejects_unknown_attributes(self):
+        """Test slotted config objects reject misspelled fields."""
+        config = AudioConfig()
+
+        with pytest.raises(AttributeError):
+            config.sample_rte = 8000  # type: ignore[attr-defined]
+
     def test_custom_values(self):
         """Test custom values for AudioConfig."""
         config = AudioConfig(
@@ -292,6 +312,37 @@ def test_handles_empty_yaml_file(self):
 
             Path(f.name).unlink()
 
+    def test_reuses_parsed_file_until_it_changes(self, tmp_path: Path):
+        """Test an unchanged file is parsed once, and edits are picked up."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("audio:\n  sample_rate: 44100\n")
+
+        with patch("src.config.yaml.load", wraps=yaml.load) as mock_load:
+            first = Config.from_yaml(str(config_file))
+            first.audio.sample_rate = 8000  # Must not leak into the next load
+            second = Config.from_yaml(str(config_file))
+
+            assert mock_load.call_count == 1
+            assert second is not first
+            assert second.audio.sample_rate == 44100
+
+            config_file.write_text("audio:\n  sample_rate: 16000\n  channels: 2\n")
+            third = Config.from_yaml(str(config_file))
+
+            assert mock_load.call_count == 2
+            assert third.audio.channels == 2
+
+    def test_rejects_python_object_tags(self):
+        """Test the YAML loader stays a safe loader."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            f.write("audio: !!python/object/apply:os.getcwd []\n")
+            f.flush()
+
+            with pytest.raises(yaml.YAMLError):
+                Config.from_yaml(f.name)
+
+            Path(f.name).unlink()
+
     def test_handles_partial_yaml_file(self):
         """Test loading from partial YAML file."""
         yaml_content = """
@@ -337,6 +388,23 @@ def test_invalid_sample_rate_fails(self):
         with pytest.raises(ValueError, match="Invalid sample_rate"):
             config.validate()
 
+    @pytest.mark.parametrize(
+        ("config", "message"),
+        [
+            (Config(audio=AudioConfig(sample_rate=[16000])), "Invalid sample_rate"),
+            (Config(audio=AudioConfig(channels=[1])), "Invalid channels"),
+            (Config(transcription=TranscriptionConfig(model_size=["base"])), "Invalid model_size"),
+            (
+                Config(transcription=TranscriptionConfig(compute_type={"int8": 1})),
+                "Invalid compute_type",
+            ),
+        ],
+    )
+    def test_unhashable_values_fail_with_value_error(self, config: Config, message: str):
+        """Test YAML lists/mappings in enumerated fields raise ValueError, not TypeError."""
+        with pytest.raises(ValueError, match=message):
+            config.validate()
+
     def test_valid_sample_rates(self):
         """Test that valid sample rates pass validation."""
         valid_rates = [8000, 16000, 22050, 44100, 48000]
@@ -486,6 +554,27 @@ def test_all_fields_present(self):
         assert "language" in result["transcription"]
         assert "device" in result["transcription"]
 
+    def test_round_trips_through_dataclasses(self):
+        """Test every section rebuilds an equal config (no field left out)."""
+        config = Config()
+        config.history.max_entries = 42
+        config.transcription.streaming_enabled = True
+
+        result = config.to_dict()
+
+        rebuilt = Config(
+            audio=AudioConfig(**result["audio"]),
+            vad=VADConfig(**result["vad"]),
+            transcription=TranscriptionConfig(**result["transcription"]),
+            punctuation=PunctuationConfig(**result["punctuation"]),
+            clipboard=ClipboardConfig(**result["clipboard"]),
+            paste=PasteConfig(**result["paste"]),
+            logging=LoggingConfig(**result["logging"]),
+            hotkey=HotkeyConfig(**result["hotkey"]),
+            history=HistoryConfig(**result["history"]),
+        )
+        assert rebuilt == config
+
 
 class TestConfigSaveToYaml:
     """Tests for Config.save_to_yaml method."""
@@ -519,6 +608,22 @@ def test_creates_parent_directories(self):
 
             assert filepath.exists()
 
+    def test_keeps_declaration_order(self, tmp_path: Path):
+        """Test sections and fields are written in declaration order, not sorted."""
+        filepath = tmp_path / "config.yaml"
+
+        Config().save_to_yaml(str(filepath))
+
+        top_level = [line[:-1] for line in filepath.read_text().splitlines() if line[0] != " "]
+        assert top_level == list(Config().to_dict())
+
+    def test_section_table_matches_config_fields(self):
+        """Test the section table lists every Config section and sub-config field."""
+        config = Config()
+        assert [section for section, _ in _SECTION_FIELDS] == [f.name for f in fields(Config)]
+        for section, names in _SECTION_FIELDS:
+            assert names == tuple(f.name for f in fields(getattr(config, section)))
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,9 +1,16 @@
 """Tests for transcription history module."""
 
+import errno
 import json
+import os
+import stat
 import tempfile
+import threading
+import time
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -57,6 +64,12 @@ def test_to_dict(self):
         assert d["audio_duration"] == 1.5
         assert d["transcription_time"] == 0.5
 
+    def test_to_dict_covers_all_fields(self):
+        """Test to_dict matches dataclasses.asdict (no field left out)."""
+        entry = TranscriptionEntry.create(text="Hello", language="en", audio_duration=1.0)
+
+        assert entry.to_dict() == asdict(entry)
+
     def test_from_dict(self):
         """Test creating entry from dictionary."""
         data = {
@@ -171,6 +184,31 @@ def test_get_all(self):
         assert all_entries[0].text == "First"  # Oldest first
         assert all_entries[1].text == "Second"
 
+    def test_reads_do_not_wait_for_writers(self):
+        """Test readers use the published snapshot while a writer holds the lock."""
+        history = TranscriptionHistory(history_file=None)
+        history.add(text="First")
+        history.get_all()  # First read after the add publishes the snapshot
+
+        with history._lock:  # e.g. a save in progress
+            assert [e.text for e in history.get_recent()] == ["First"]
+            assert [e.text for e in history.get_all()] == ["First"]
+            assert [e.text for e in history.search("first")] == ["First"]
+            assert len(history) == 1
+
+    def test_add_defers_snapshot_copy_to_next_read(self):
+        """Test adds only mark the snapshot stale; one read rebuilds it."""
+        history = TranscriptionHistory(history_file=None)
+        history.add(text="First")
+        history.add(text="Second")
+
+        assert history._snapshot is None
+        assert len(history) == 2
+        assert [e.text for e in history.get_recent()] == ["Second", "First"]
+        snapshot = history._snapshot
+        assert [e.text for e in history.get_all()] == ["First", "Second"]
+        assert history._snapshot is snapshot
+
     def test_search(self):
         """Test searching entries."""
         history = TranscriptionHistory(history_file=None)
@@ -240,6 +278,23 @@ def test_save_and_load(self):
             assert entries[0].language == "en"
             assert entries[1].text == "Second"
 
+    def test_load_keeps_newest_entries(self):
+        """Test loading a file larger than max_entries keeps the newest entries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            history_file = Path(tmpdir) / "history.json"
+
+            history1 = TranscriptionHistory(history_file=history_file)
+            for i in range(5):
+                history1.add(text=f"Entry {i}")
+
+            history2 = TranscriptionHistory(history_file=history_file, max_entries=3)
+            assert [e.text for e in history2.get_all()] == ["Entry 2", "Entry 3", "Entry 4"]
+
+            # Still bounded after loading
+            history2.add(text="Entry 5")
+            assert [e.text for e in history2.get_recent(2)] == ["Entry 5", "Entry 4"]
+            assert len(history2) == 3
+
     def test_creates_parent_directories(self):
         """Test that parent directories are created."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -250,6 +305,72 @@ def test_creates_parent_directories(self):
 
             assert history_file.exists()
 
+    def test_failed_save_keeps_previous_file(self):
+        """Test a save that fails mid-write leaves the previous history intact."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            history_file = Path(tmpdir) / "history.json"
+
+            history = TranscriptionHistory(history_file=history_file)
+            history.add(text="Kept")
+
+            with patch("src.history.json.dumps", side_effect=ValueError("boom")):
+                history.add(text="Lost")
+
+            reloaded = TranscriptionHistory(history_file=history_file)
+            assert [e.text for e in reloaded.get_all()] == ["Kept"]
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["history.json"]
+
+    def test_failed_write_removes_temp_file(self):
+        """Test a write error (e.g. disk full) keeps the old file and no temp file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            history_file = Path(tmpdir) / "history.json"
+
+            history = TranscriptionHistory(history_file=history_file)
+            history.add(text="Kept")
+
+            real_fdopen = os.fdopen
+
+            def fdopen_disk_full(fd, *args, **kwargs):
+                f = real_fdopen(fd, *args, **kwargs)
+                f.write = MagicMock(side_effect=OSError(errno.ENOSPC, "No space left"))
+                return f
+
+            with patch("src.history.os.fdopen", side_effect=fdopen_disk_full):
+                history.add(text="Lost")
+
+            reloaded = TranscriptionHistory(history_file=history_file)
+            assert [e.text for e in reloaded.get_all()] == ["Kept"]
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["history.json"]
+
+    def test_save_writes_through_symlink(self):
+        """Test a symlinked history file stays a link to the updated real file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            real_dir = Path(tmpdir) / "real"
+            real_dir.mkdir()
+            real_file = real_dir / "history.json"
+            history_file = Path(tmpdir) / "history.json"
+            history_file.symlink_to(real_file)
+
+            history = TranscriptionHistory(history_file=history_file)
+            history.add(text="Linked")
+
+            assert history_file.is_symlink()
+            assert json.loads(real_file.read_text())["entries"][0]["text"] == "Linked"
+            assert sorted(p.name for p in real_dir.iterdir()) == ["history.json"]
+
+    def test_save_keeps_file_mode(self):
+        """Test saving keeps the history file's mode; new files are private."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            history_file = Path(tmpdir) / "history.json"
+
+            history = TranscriptionHistory(history_file=history_file)
+            history.add(text="First")
+            assert stat.S_IMODE(history_file.stat().st_mode) == 0o600
+
+            history_file.chmod(0o640)
+            history.add(text="Second")
+            assert stat.S_IMODE(history_file.stat().st_mode) == 0o640
+
     def test_handles_corrupted_file(self):
         """Test handling of corrupted history file."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -302,6 +423,94 @@ def test_manual_save(self):
                 data = json.load(f)
             assert len(data["entries"]) == 2
 
+    def test_batched_auto_save_waits_for_flush(self):
+        """Test batched auto-save defers writing until flushed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            history_file = Path(tmpdir) / "history.json"
+
+            with patch("src.history.threading.Timer") as mock_timer:
+                history = TranscriptionHistory(history_file=history_file, flush_interval=2.0)
+                history.add(text="First")
+                history.add(text="Second")
+
+                assert not history_file.exists()
+                # Each add re-arms the inactivity timer
+                assert mock_timer.call_count == 2
+                mock_timer.return_value.cancel.assert_called_once()
+
+                # The timer fires flush()
+                flush = mock_timer.call_args[0][1]
+                flush()
+
+            with open(history_file) as f:
+                data = json.load(f)
+            assert len(data["entries"]) == 2
+
+    def test_batched_auto_save_flushes_full_batch(self):
+        """Test batched auto-save writes as soon as the batch is full."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            history_file = Path(tmpdir) / "history.json"
+
+            with patch("src.history.threading.Timer"):
+                history = TranscriptionHistory(
+                    history_file=history_file, flush_interval=2.0, flush_batch_size=3
+                )
+                for i in range(3):
+                    history.add(text=f"Entry {i}")
+
+            with open(history_file) as f:
+                data = json.load(f)
+            assert len(data["entries"]) == 3
+
+    def test_flush_without_pending_entries_does_not_write(self):
+        """Test flush is a no-op when nothing is waiting to be saved."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            history_file = Path(tmpdir) / "history.json"
+
+            history = TranscriptionHistory(history_file=history_file, flush_interval=2.0)
+            history.flush()
+
+            assert not history_file.exists()
+
+    def test_failed_flush_keeps_entries_pending(self):
+        """Test entries stay pending after a failed save, so the next flush retries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            history_file = Path(tmpdir) / "history.json"
+
+            with patch("src.history.threading.Timer"):
+                history = TranscriptionHistory(history_file=history_file, flush_interval=2.0)
+                history.add(text="Retried")
+
+                with patch("src.history.os.replace", side_effect=OSError("read-only")):
+                    history.flush()
+                assert history._pending_writes == 1
+                assert not history_file.exists()
+
+                history.flush()
+
+            assert history._pending_writes == 0
+            reloaded = TranscriptionHistory(history_file=history_file)
+            assert [e.text for e in reloaded.get_all()] == ["Retried"]
+
+    def test_close_saves_pending_entries_and_stops_batching(self):
+        """Test close writes pending entries, cancels the timer and drops the exit hook."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            history_file = Path(tmpdir) / "history.json"
+
+            with (
+                patch("src.history.threading.Timer") as mock_timer,
+                patch("src.history.atexit") as mock_atexit,
+            ):
+                history = TranscriptionHistory(history_file=history_file, flush_interval=2.0)
+                history.add(text="Pending")
+                history.close()
+
+            mock_timer.return_value.cancel.assert_called_once()
+            mock_atexit.unregister.assert_called_once_with(history.flush)
+            assert history._flush_timer is None
+            reloaded = TranscriptionHistory(history_file=history_file)
+            assert [e.text for e in reloaded.get_all()] == ["Pending"]
+
     def test_file_format_version(self):
         """Test file includes version field."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -329,6 +538,31 @@ def test_creates_global_instance(self):
         history2 = get_history()
         assert history1 is history2
 
+    def test_concurrent_first_calls_create_one_instance(self):
+        """Test racing first calls share a single instance."""
+        import src.history
+
+        src.history._history = None
+        real_history = src.history.TranscriptionHistory
+
+        def slow_history(**kwargs):
+            time.sleep(0.05)
+            return real_history(**kwargs)
+
+        results = []
+        with patch("src.history.TranscriptionHistory", side_effect=slow_history) as mock_cls:
+            threads = [
+                threading.Thread(target=lambda: results.append(get_history())) for _ in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert mock_cls.call_count == 1
+        assert all(h is results[0] for h in results)
+        src.history._history = None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -5,7 +5,7 @@
 
 import pytest
 
-from src.hotkey import TriggerClient, TriggerServer, TriggerType
+from src.hotkey import _TRIGGER_MAP, TriggerClient, TriggerServer, TriggerType
 
 
 def test_trigger_type_enum():
@@ -16,6 +16,13 @@ def test_trigger_type_enum():
     assert TriggerType.UNKNOWN.value == "TRIGGER"
 
 
+def test_trigger_map_matches_enum_values():
+    """Test every non-legacy trigger type is reachable by its wire value."""
+    for trigger_type in (TriggerType.COPY, TriggerType.PASTE, TriggerType.PASTE_TERMINAL):
+        assert _TRIGGER_MAP[trigger_type.value.encode()] is trigger_type
+    assert b"TRIGGER" not in _TRIGGER_MAP
+
+
 def test_trigger_server_initialization():
     """Test TriggerServer initialization."""
     server = TriggerServer(socket_path="/tmp/test-stt.sock")
@@ -280,6 +287,58 @@ async def callback(trigger_type: TriggerType):
         finally:
             await server.stop()
 
+    @pytest.mark.asyncio
+    async def test_message_without_newline(self):
+        """Test a message closed without a trailing newline is still parsed."""
+        socket_path = "/tmp/test-stt-no-newline.sock"
+        received_trigger = None
+
+        async def callback(trigger_type: TriggerType):
+            nonlocal received_trigger
+            received_trigger = trigger_type
+
+        server = TriggerServer(socket_path=socket_path, on_trigger=callback)
+
+        try:
+            await server.start()
+
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            writer.write(b"TRIGGER_PASTE")
+            writer.write_eof()
+            response = await asyncio.wait_for(reader.read(), timeout=2.0)
+            writer.close()
+            await writer.wait_closed()
+
+            assert response == b"OK\n"
+            assert received_trigger == TriggerType.PASTE
+
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_oversized_message_is_unknown(self):
+        """Test a message longer than the read limit maps to UNKNOWN."""
+        socket_path = "/tmp/test-stt-oversized.sock"
+        received_trigger = None
+
+        async def callback(trigger_type: TriggerType):
+            nonlocal received_trigger
+            received_trigger = trigger_type
+
+        server = TriggerServer(socket_path=socket_path, on_trigger=callback)
+
+        try:
+            await server.start()
+
+            client = TriggerClient(socket_path=socket_path)
+            success = await client.send_trigger(trigger_type="TRIGGER_COPY" * 50, timeout=2.0)
+
+            assert success is True
+            assert received_trigger == TriggerType.UNKNOWN
+
+        finally:
+            await server.stop()
+
 
 class TestTriggerClientExtended:
     """Extended tests for TriggerClient."""
@@ -290,6 +349,55 @@ def test_send_trigger_sync(self):
         success = client.send_trigger_sync(trigger_type="TRIGGER_COPY", timeout=0.5)
         assert success is False
 
+    @pytest.mark.asyncio
+    async def test_send_trigger_sync_success(self):
+        """Test synchronous trigger sending reaches a running server."""
+        socket_path = "/tmp/test-stt-sync-success.sock"
+        received_trigger = None
+
+        async def callback(trigger_type: TriggerType):
+            nonlocal received_trigger
+            received_trigger = trigger_type
+
+        server = TriggerServer(socket_path=socket_path, on_trigger=callback)
+
+        try:
+            await server.start()
+
+            client = TriggerClient(socket_path=socket_path)
+            success = await asyncio.to_thread(
+                client.send_trigger_sync, trigger_type="TRIGGER_PASTE", timeout=2.0
+            )
+
+            assert success is True
+            assert received_trigger == TriggerType.PASTE
+
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_send_trigger_sync_timeout(self):
+        """Test synchronous trigger sending times out on a slow server."""
+        socket_path = "/tmp/test-stt-sync-timeout.sock"
+
+        async def slow_callback(trigger_type: TriggerType):
+            await asyncio.sleep(1)
+
+        server = TriggerServer(socket_path=socket_path, on_trigger=slow_callback)
+
+        try:
+            await server.start()
+
+            client = TriggerClient(socket_path=socket_path)
+            success = await asyncio.to_thread(
+                client.send_trigger_sync, trigger_type="TRIGGER_COPY", timeout=0.1
+            )
+
+            assert success is False
+
+        finally:
+            await server.stop()
+
     @pytest.mark.asyncio
     async def test_client_timeout(self):
         """Test client timeout handling."""
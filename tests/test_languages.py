@@ -60,6 +60,11 @@ def test_from_code_unsupported(self):
         """Test unsupported code returns None."""
         assert SupportedLanguage.from_code("jp") is None
 
+    def test_from_code_all_members(self):
+        """Test every supported language is found from its code."""
+        for lang in SupportedLanguage:
+            assert SupportedLanguage.from_code(lang.value) is lang
+
 
 class TestSupportedLanguageIsSupported:
     """Tests for SupportedLanguage.is_supported method."""
@@ -139,6 +144,18 @@ def test_italian_rules(self):
         rules = LANGUAGE_RULES[SupportedLanguage.ITALIAN]
         assert rules.opening_quote == "\u00ab"  # French-style quotes
 
+    def test_filler_pattern_matches_whole_words(self):
+        """Test the compiled filler pattern removes whole filler words only."""
+        rules = LANGUAGE_RULES[SupportedLanguage.ENGLISH]
+        text = rules.filler_pattern.sub("", "Um I like you know the plum")
+        assert text.split() == ["I", "the", "plum"]
+
+    def test_empty_lists_never_match(self):
+        """Test empty rule lists compile to patterns that match nothing."""
+        rules = LanguageRules(no_space_before_punctuation=[])
+        assert rules.filler_pattern.search("euh hum") is None
+        assert rules.no_space_pattern.search("a , b .") is None
+
 
 class TestGetLanguageRules:
     """Tests for get_language_rules function."""
@@ -163,6 +180,11 @@ def test_unsupported_returns_english_default(self):
         rules = get_language_rules("jp")
         assert rules == LANGUAGE_RULES[SupportedLanguage.ENGLISH]
 
+    def test_returns_shared_rules_instance(self):
+        """Test repeated lookups return the module-level rules object."""
+        assert get_language_rules("fr") is LANGUAGE_RULES[SupportedLanguage.FRENCH]
+        assert get_language_rules("fr") is get_language_rules("FR")
+
 
 class TestGetDisplayName:
     """Tests for get_display_name function."""
@@ -1,5 +1,7 @@
 """Tests for TUI settings screen."""
 
+from unittest.mock import patch
+
 import pytest
 
 from src.config import (
@@ -576,6 +578,44 @@ def test_should_enable_history_on_reload(self, test_config: Config) -> None:
         assert app.history is not None
         assert app.config.history.enabled is True
 
+    def test_should_close_old_history_and_keep_flush_interval_on_reload(
+        self, test_config: Config, tmp_path
+    ) -> None:
+        """Test the replaced history is closed and the new one keeps batching."""
+        from src.tui import STTApp
+
+        test_config.history.enabled = True
+        test_config.history.file = str(tmp_path / "history.json")
+        test_config.history.flush_interval = 2.0
+        app = STTApp(test_config)
+        old_history = app.history
+        assert old_history is not None
+
+        new_config = Config(
+            audio=test_config.audio,
+            vad=test_config.vad,
+            transcription=test_config.transcription,
+            punctuation=test_config.punctuation,
+            clipboard=test_config.clipboard,
+            paste=test_config.paste,
+            hotkey=test_config.hotkey,
+            logging=test_config.logging,
+            history=HistoryConfig(
+                enabled=True,
+                file=str(tmp_path / "history.json"),
+                max_entries=50,
+                auto_save=True,
+                flush_interval=2.0,
+            ),
+        )
+
+        with patch.object(old_history, "close") as mock_close:
+            app.reload_config(new_config)
+
+        mock_close.assert_called_once()
+        assert app.history is not old_history
+        assert app.history.flush_interval == 2.0
+
     def test_should_disable_history_on_reload(self, test_config: Config) -> None:
         """Test that history is disabled when reload_config is called with enabled=False."""
         from src.tui import STTApp